@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class AbstractsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField' 
     name = 'apps.abstracts'
+
+    def ready(self) -> None:
+        from apps.abstracts import signals  # noqa: F401
+        from apps.abstracts.utils import warm_welcome_templates
+
+        # The first sign-up of every language skips template compilation
+        warm_welcome_templates()
@@ -0,0 +1,29 @@
+# Python modules
+from typing import Optional
+
+# Django modules
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework.request import Request as DRFRequest
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import Token
+
+
+class SharedTokenJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that reuses the token validated by
+    UserLanguageMiddleware instead of verifying the signature again.
+    """
+
+    def authenticate(self, request: DRFRequest) -> Optional[tuple[object, Token]]:
+        validated_token: Optional[Token] = getattr(request._request, 'validated_token', None)
+
+        if validated_token is None:
+            return super().authenticate(request)
+
+        return self.get_user(validated_token), validated_token
+
+
+class SharedTokenJWTScheme(SimpleJWTScheme):
+    """Documents SharedTokenJWTAuthentication as the regular JWT scheme"""
+
+    target_class = SharedTokenJWTAuthentication
@@ -0,0 +1,100 @@
+# Python modules
+from datetime import datetime
+from hashlib import md5
+from typing import Any, Optional
+
+# Django modules
+from django.db.models import Count, F, Max, Model, QuerySet, Sum
+from django.db.models.functions import Coalesce, Greatest
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+def get_validator_aggregates(model: type[Model]) -> dict[str, Any]:
+    """
+    Returns aggregates the validators of the model's rows are built from.
+
+    Rows change with `updated_at`, except for columns written by bulk
+    updates like denormalized counters. Models name those timestamps in
+    `LAST_MODIFIED_FIELDS` and other columns in `CHECKSUM_FIELDS`.
+    """
+
+    modified = [F('updated_at')] + [
+        Coalesce(name, 'updated_at') for name in getattr(model, 'LAST_MODIFIED_FIELDS', ())
+    ]
+
+    aggregates = {
+        'last_modified': Max(Greatest(*modified) if len(modified) > 1 else modified[0]),
+        'count': Count('pk'),
+        'checksum': Sum('pk'),
+    }
+    for name in getattr(model, 'CHECKSUM_FIELDS', ()):
+        aggregates[f'checksum_{name}'] = Sum(name)
+
+    return aggregates
+
+
+def build_validators(stats: dict[str, Any], *parts: Any) -> tuple[Optional[str], Optional[datetime]]:
+    """Returns weak ETag and Last-Modified built from aggregated rows"""
+
+    if not stats['count']:
+        return None, None
+
+    raw = repr((sorted(stats.items()), *parts))
+    etag = f'W/"{md5(raw.encode("utf-8")).hexdigest()}"'
+
+    return etag, stats['last_modified']
+
+
+def get_queryset_validators(queryset: QuerySet, *parts: Any) -> tuple[Optional[str], Optional[datetime]]:
+    """
+    Returns weak ETag and Last-Modified of the rows of the queryset with one
+    aggregate query. `parts` are whatever else the representation depends on.
+    """
+
+    return build_validators(queryset.aggregate(**get_validator_aggregates(queryset.model)), *parts)
+
+
+async def aget_queryset_validators(queryset: QuerySet, *parts: Any) -> tuple[Optional[str], Optional[datetime]]:
+    """Async version of get_queryset_validators"""
+
+    return build_validators(
+        await queryset.aaggregate(**get_validator_aggregates(queryset.model)),
+        *parts,
+    )
+
+
+def get_not_modified_response(
+    request: HttpRequest,
+    etag: Optional[str],
+    last_modified: Optional[datetime],
+) -> Optional[HttpResponse]:
+    """Returns 304/412 response when client's copy is current, otherwise None"""
+
+    if etag is None:
+        return None
+
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is not None:
+        set_validator_headers(response, etag, last_modified)
+
+    return response
+
+
+def set_validator_headers(
+    response: HttpResponse,
+    etag: Optional[str],
+    last_modified: Optional[datetime],
+) -> HttpResponse:
+    """Adds ETag and Last-Modified headers to the response"""
+
+    if etag is not None:
+        response.headers['ETag'] = etag
+    if last_modified is not None:
+        response.headers['Last-Modified'] = http_date(last_modified.timestamp())
+
+    return response
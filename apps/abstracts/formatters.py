@@ -0,0 +1,84 @@
+# Python modules
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+# Django modules
+from django.utils.translation import get_language
+from rest_framework.request import Request as DRFRequest
+from babel import Locale
+from babel.dates import (
+    DateTimePattern,
+    get_date_format,
+    get_datetime_format,
+    get_time_format,
+    parse_pattern,
+)
+
+DEFAULT_TIMEZONE = 'UTC'
+
+
+def get_request_timezone(request: Optional[DRFRequest]) -> str:
+    """Returns timezone of the authenticated user or the default one"""
+
+    if request and hasattr(request, 'user') and request.user.is_authenticated:
+        return request.user.timezone
+
+    return DEFAULT_TIMEZONE
+
+
+@lru_cache(maxsize=None)
+def get_zone(tz_name: str) -> ZoneInfo:
+    """Returns ZoneInfo for the timezone name"""
+    return ZoneInfo(tz_name)
+
+
+@lru_cache(maxsize=None)
+def get_datetime_patterns(
+    language: str,
+    format: str,
+) -> tuple[Locale, str, DateTimePattern, DateTimePattern]:
+    """
+    Returns parsed babel patterns that format_datetime would build for
+    the (language, format) pair on every call.
+    """
+
+    locale = Locale.parse(language)
+    glue = get_datetime_format(format, locale=locale).replace("'", "")
+    date_pattern = parse_pattern(get_date_format(format, locale=locale))
+    time_pattern = parse_pattern(get_time_format(format, locale=locale))
+
+    return locale, glue, date_pattern, time_pattern
+
+
+class LocalDateTimeFormatter:
+    """
+    Formats datetimes in a fixed timezone and locale.
+
+    Produces the same output as babel format_datetime, but the timezone,
+    locale and patterns are resolved once and reused for every value.
+    """
+
+    def __init__(self, language: str, tz_name: str, format: str = 'long') -> None:
+        self.zone = get_zone(tz_name)
+        self.locale, self.glue, self.date_pattern, self.time_pattern = (
+            get_datetime_patterns(language, format)
+        )
+
+    @classmethod
+    def for_request(cls, request: Optional[DRFRequest], format: str = 'long') -> 'LocalDateTimeFormatter':
+        """Returns formatter for the active language and the user's timezone"""
+
+        return cls(get_language(), get_request_timezone(request), format)
+
+    def format(self, dt: datetime) -> str:
+        """Returns localized representation of the datetime"""
+
+        localized = dt.astimezone(self.zone)
+
+        return (
+            self.glue
+            .replace('{0}', self.time_pattern.apply(localized.timetz(), self.locale, reference_date=localized.date()))
+            .replace('{1}', self.date_pattern.apply(localized.date(), self.locale))
+        )
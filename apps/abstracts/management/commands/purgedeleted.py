@@ -0,0 +1,83 @@
+# Python modules
+from datetime import timedelta
+from time import sleep
+from typing import Any
+
+# Django modules
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.utils import timezone
+
+# Project modules
+from apps.abstracts.models import AbstractBaseModel
+
+
+class Command(BaseCommand):
+    help = "Deletes for good the rows soft deleted long enough ago"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=30,
+            help="Purge rows soft deleted more than this many days ago",
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between batches, lets other writers in",
+        )
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='models',
+            metavar='APP_LABEL.MODEL',
+            help="Limit the purge to the model, can be repeated",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        cutoff = timezone.now() - timedelta(days=options['days'])
+
+        for model in self.get_models(options['models']):
+            purged = 0
+
+            while True:
+                # Short transactions over a bounded set of rows keep locks
+                # brief however many tombstones there are.
+                pks = list(
+                    model.all_objects.filter(deleted_at__lt=cutoff)
+                    .order_by('pk')
+                    .values_list('pk', flat=True)[:options['batch_size']]
+                )
+                if not pks:
+                    break
+
+                with transaction.atomic():
+                    model.all_objects.filter(pk__in=pks).purge(older_than=cutoff)
+
+                purged += len(pks)
+                if options['pause']:
+                    sleep(options['pause'])
+
+            self.stdout.write(f"{model._meta.label}: purged {purged}")
+
+    @staticmethod
+    def get_models(labels: list[str] | None) -> list[type[AbstractBaseModel]]:
+        models = [
+            model for model in apps.get_models()
+            if issubclass(model, AbstractBaseModel)
+        ]
+
+        if labels:
+            try:
+                wanted = {apps.get_model(label) for label in labels}
+            except (LookupError, ValueError) as exc:
+                raise CommandError(str(exc))
+            models = [model for model in models if model in wanted]
+
+        # Apps are installed before the apps depending on them, so going
+        # backwards purges children before their cascading parents.
+        return models[::-1]
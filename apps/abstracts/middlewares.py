@@ -1,5 +1,7 @@
-from typing import Callable, Optional, Any
+from typing import Callable, Optional
 
+from asgiref.sync import iscoroutinefunction
+from django.utils.decorators import sync_and_async_middleware
 from django.utils.translation import activate, deactivate
 from django.core.handlers.wsgi import WSGIRequest
 from rest_framework.request import Request as DRFRequest
@@ -9,44 +11,110 @@ from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import TokenError
 
 from apps.users.models import CustomUser
+from apps.users.tokens import LANGUAGE_CLAIM
+from apps.users.caches import (
+    get_cached_preferred_language,
+    get_preferred_language,
+    aget_cached_preferred_language,
+    aget_preferred_language,
+    language_changes,
+)
 from settings.base import DEFAULT_LANGUAGE_CODE
 
+@sync_and_async_middleware
 def UserLanguageMiddleware(get_response: Callable) -> Callable:
     """User preferred language identificattion middleware"""
-    
-    def get_user_id_from_jwt(request: WSGIRequest) -> Optional[int]:
-        """Exract user_id from JWT token"""
+
+    def get_validated_token(request: WSGIRequest) -> Optional[AccessToken]:
+        """Exract and validate JWT access token"""
 
         auth_header = request.headers.get("Authorization", "")
         if not auth_header.startswith("Bearer "):
             return None
-        
+
         access_token:str = auth_header.strip().split(" ")[1]
 
         try:
-            payload:dict[str, Any] = AccessToken(access_token)
-            return payload.get("user_id")
+            return AccessToken(access_token)
         except TokenError:
             return None
-        
-        
-    def determine_language(request:WSGIRequest) -> str:
-        """Determines the language for that will be used in request"""
 
-        user_id: Optional[int] = get_user_id_from_jwt(request)  
-        if user_id is not None:
-            return CustomUser.objects.get(pk=user_id).preferred_language
-        
+
+    def get_token(request: WSGIRequest) -> Optional[AccessToken]:
+        """Validates JWT once and shares it with SharedTokenJWTAuthentication"""
+
+        token: Optional[AccessToken] = get_validated_token(request)
+        request.validated_token = token
+        return token
+
+
+    def get_request_language(request: WSGIRequest) -> str:
+        """Determines the language from query and headers of request"""
+
         query_lang: Optional[str] = request.GET.get('lang')
-        if query_lang is not None: 
+        if query_lang is not None:
             return normalize(query_lang)
-        
+
         header_lang: Optional[str] = request.headers.get("Accept-Language")
         if query_lang is not None:
             return normalize(header_lang)
 
-        return DEFAULT_LANGUAGE_CODE 
-    
+        return DEFAULT_LANGUAGE_CODE
+
+
+    def determine_language(request:WSGIRequest) -> str:
+        """Determines the language for that will be used in request"""
+
+        token: Optional[AccessToken] = get_token(request)
+
+        if token is not None:
+            user_id: Optional[int] = token.get("user_id")
+            token_lang: Optional[str] = token.get(LANGUAGE_CLAIM)
+
+            # Tokens issued after the latest language change carry a current claim
+            if token_lang is not None and token.get("iat", 0) > language_changes.get():
+                return normalize(token_lang)
+
+            # Saving the user caches its language, which is newer than the claim
+            cached_lang: Optional[str] = get_cached_preferred_language(user_id) if user_id else None
+            if cached_lang is not None:
+                return normalize(cached_lang)
+
+            if token_lang is not None:
+                return normalize(token_lang)
+
+            user_lang: Optional[str] = get_preferred_language(user_id) if user_id else None
+            if user_lang is not None:
+                return normalize(user_lang)
+
+        return get_request_language(request)
+
+
+    async def adetermine_language(request:WSGIRequest) -> str:
+        """Async version of determine_language"""
+
+        token: Optional[AccessToken] = get_token(request)
+
+        if token is not None:
+            user_id: Optional[int] = token.get("user_id")
+            token_lang: Optional[str] = token.get(LANGUAGE_CLAIM)
+
+            if token_lang is not None and token.get("iat", 0) > await language_changes.aget():
+                return normalize(token_lang)
+
+            cached_lang: Optional[str] = await aget_cached_preferred_language(user_id) if user_id else None
+            if cached_lang is not None:
+                return normalize(cached_lang)
+
+            if token_lang is not None:
+                return normalize(token_lang)
+
+            user_lang: Optional[str] = await aget_preferred_language(user_id) if user_id else None
+            if user_lang is not None:
+                return normalize(user_lang)
+
+        return get_request_language(request)
+
 
     def normalize(lang:str) -> str:
         """Normalizing language code"""
@@ -55,20 +123,35 @@ def UserLanguageMiddleware(get_response: Callable) -> Callable:
         return lang if lang in CustomUser.LANGUAGE_CODES else DEFAULT_LANGUAGE_CODE
 
 
+    if iscoroutinefunction(get_response):
+
+        async def amiddleware(request: WSGIRequest) -> DRFResponse:
+            """Takes request language header and process"""
+            lang = await adetermine_language(request)
+            activate(lang)
+            request.LANGUAGE_CODE = lang
+
+            response: DRFResponse = await get_response(request)
+            response.headers.setdefault("Content-Language", lang)
+
+            deactivate()
+
+            return response
+
+        return amiddleware
+
+
     def middleware(request: WSGIRequest) -> DRFResponse:
         """Takes request language header and process"""
         lang = determine_language(request)
         activate(lang)
-        print(lang)
         request.LANGUAGE_CODE = lang
 
         response: DRFResponse = get_response(request)
         response.headers.setdefault("Content-Language", lang)
-            
+
         deactivate()
 
         return response
-    
-    return middleware
-
 
+    return middleware
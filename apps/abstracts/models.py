@@ -1,13 +1,95 @@
 # Python models
-from typing import Any
+from datetime import datetime, timedelta
+from typing import Any, Optional
 
 # Django models
-from django.db.models import Model, DateTimeField
+from django.db import IntegrityError, transaction
+from django.db.models import Manager, Model, DateTimeField, QuerySet
 from django.utils import timezone as django_timezone
 
+# Project modules
+from apps.abstracts.slugs import make_base_slug, next_available_slug, random_suffixed_slug
+from apps.abstracts.signals import soft_delete_changed
+
+
+class SoftDeleteQuerySet(QuerySet):
+    """
+    QuerySet with bulk soft deletion.
+
+    `soft_delete()` and `restore()` are single UPDATEs; receivers of
+    `soft_delete_changed` cost one extra query to collect affected ids.
+    `delete()` keeps Django's behaviour and removes the rows, like the
+    admin and cascades expect; `hard_delete()` spells that out.
+    """
+
+    def hard_delete(self) -> tuple[int, dict[str, int]]:
+        """Deletes the rows for good, same as `delete()`"""
+
+        return self.delete()
+
+    hard_delete.alters_data = True
+    hard_delete.queryset_only = True
+
+    def soft_delete(self) -> int:
+        """Marks the rows as deleted with one UPDATE"""
+
+        return self._set_deleted_at(django_timezone.now())
+
+    soft_delete.alters_data = True
+
+    def restore(self) -> int:
+        """
+        Brings soft deleted rows back with one UPDATE. Call it through
+        `all_objects`, `objects` doesn't see deleted rows at all.
+        """
+
+        return self._set_deleted_at(None)
+
+    restore.alters_data = True
+
+    def purge(self, older_than: timedelta | datetime) -> tuple[int, dict[str, int]]:
+        """
+        Deletes for good the rows soft deleted before the cutoff. Nothing
+        else cascading, that is a single DELETE. Live rows that cascade
+        from them go too, with the usual delete signals.
+        """
+
+        cutoff = older_than if isinstance(older_than, datetime) else django_timezone.now() - older_than
+        return self.filter(deleted_at__lt=cutoff).hard_delete()
+
+    purge.alters_data = True
+
+    def _set_deleted_at(self, deleted_at: Optional[datetime]) -> int:
+        queryset = self.filter(deleted_at__isnull=deleted_at is not None)
+
+        pks = None
+        if soft_delete_changed.has_listeners(self.model):
+            pks = list(queryset.values_list('pk', flat=True))
+            if not pks:
+                return 0
+
+        count = queryset.update(deleted_at=deleted_at, updated_at=django_timezone.now())
+
+        if pks is not None:
+            soft_delete_changed.send(self.model, pks=pks, deleted=deleted_at is not None)
+
+        return count
+
+
+class AliveManager(Manager.from_queryset(SoftDeleteQuerySet)):
+    """Manager that leaves soft deleted rows out"""
+
+    def get_queryset(self) -> QuerySet:
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
 class AbstractBaseModel(Model):
     """
-    Abstract base model with fields that common for all models
+    Abstract base model with fields that common for all models.
+
+    `objects` only sees rows that are not soft deleted, `all_objects` sees
+    every row. Subclasses overriding `objects` have to name it in
+    `Meta.default_manager_name`, otherwise `all_objects` becomes default.
     """
 
     created_at = DateTimeField(
@@ -21,6 +103,9 @@ class AbstractBaseModel(Model):
         blank=True
     )
 
+    objects = AliveManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
     class Meta:
         """Meta class for AbstractBaseModel."""
 
@@ -32,4 +117,38 @@ class AbstractBaseModel(Model):
         self.deleted_at = django_timezone.now()
         self.save(update_fields=["deleted_at"])
 
-        
\ No newline at end of file
+
+class SlugAllocationMixin:
+    """
+    Fills empty `slug` from `SLUG_SOURCE_FIELD` on save.
+
+    The free slug is computed with one query. Concurrent inserts that grab
+    the same slug are resolved by retrying on IntegrityError instead of
+    probing candidates before the insert; retries use a random suffix, so
+    they don't keep proposing the slug that just clashed.
+    """
+
+    SLUG_SOURCE_FIELD = 'name'
+    SLUG_MAX_ATTEMPTS = 5
+
+    def save(self, *args: tuple[Any, ...], **kwargs: dict[Any, Any]) -> None:
+        if self.slug:
+            return super().save(*args, **kwargs)
+
+        manager = type(self)._base_manager
+        base_slug = make_base_slug(getattr(self, self.SLUG_SOURCE_FIELD), type(self))
+
+        for attempt in range(self.SLUG_MAX_ATTEMPTS):
+            if attempt == 0:
+                self.slug = next_available_slug(manager.all(), base_slug)
+            else:
+                self.slug = random_suffixed_slug(base_slug)
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                slug_taken = manager.filter(slug=self.slug).exists()
+                if not slug_taken or attempt == self.SLUG_MAX_ATTEMPTS - 1:
+                    self.slug = ''
+                    raise
+
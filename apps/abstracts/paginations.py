@@ -0,0 +1,185 @@
+# Python modules
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Optional
+
+# Django modules
+from django.db.models import Q, QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request as DRFRequest
+from rest_framework.response import Response as DRFResponse
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Cursor pagination keyed on (created_at, id).
+
+    Every page is fetched with a `(created_at, id) < (cursor)` range
+    predicate instead of OFFSET, so the cost of a page does not depend
+    on how deep into the result set the client is.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 20
+    max_page_size = 100
+    invalid_cursor_message = _('Invalid cursor')
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: DRFRequest,
+        view: Any = None,
+    ) -> list[Any]:
+        """Returns the objects of the requested page"""
+
+        page_queryset = self.get_page_queryset(queryset, request)
+        return self.build_page(list(page_queryset))
+
+    def get_page_queryset(self, queryset: QuerySet, request: DRFRequest) -> QuerySet:
+        """Returns the bounded range query for the requested page"""
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.limit = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request)
+        self.reverse = False
+
+        if self.cursor is not None:
+            self.reverse, created_at, pk = self.cursor
+            if self.reverse:
+                queryset = queryset.filter(
+                    Q(created_at__gt=created_at)
+                    | Q(created_at=created_at, pk__gt=pk)
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at)
+                    | Q(created_at=created_at, pk__lt=pk)
+                )
+
+        ordering = ('created_at', 'pk') if self.reverse else ('-created_at', '-pk')
+
+        # One extra row tells whether there is a page beyond this one.
+        return queryset.order_by(*ordering)[:self.limit + 1]
+
+    def build_page(self, rows: list[Any]) -> list[Any]:
+        """Trims the look-ahead row and computes neighbour cursors"""
+
+        has_more = len(rows) > self.limit
+        page = rows[:self.limit]
+
+        if self.reverse:
+            page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        self.page = page
+        return page
+
+    def get_page_size(self, request: DRFRequest) -> int:
+        """Returns the page size requested by the client, capped by the server"""
+
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if size <= 0:
+            return self.page_size
+
+        return min(size, self.max_page_size)
+
+    def decode_cursor(self, request: DRFRequest) -> Optional[tuple[bool, datetime, int]]:
+        """Decodes the opaque cursor passed by the client"""
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            raw = urlsafe_b64decode(encoded.encode('ascii')).decode('ascii')
+            direction, created_at, pk = raw.split('|')
+            return direction == 'p', datetime.fromisoformat(created_at), int(pk)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, obj: Any, reverse: bool) -> str:
+        """Builds the url pointing to the page next to the given object"""
+
+        raw = f"{'p' if reverse else 'n'}|{obj.created_at.isoformat()}|{obj.pk}"
+        encoded = urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_data(self, data: list[Any]) -> OrderedDict:
+        """Wraps serialized page with neighbour links"""
+
+        return OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ])
+
+    def get_paginated_response(self, data: list[Any]) -> DRFResponse:
+        return DRFResponse(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view: Any) -> list[dict[str, Any]]:
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'The pagination cursor value.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': f'Number of results to return per page (max {self.max_page_size}).',
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+
+class RankedPagePagination(PageNumberPagination):
+    """
+    Page number pagination for results ordered by relevance, where there
+    is no stable column to build a keyset cursor from.
+    """
+
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
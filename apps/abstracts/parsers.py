@@ -0,0 +1,26 @@
+# Python modules
+from typing import Any, Iterator, Optional
+
+# Django modules
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline delimited JSON into a lazy iterator of raw lines.
+
+    Nothing is read until the view iterates `request.data`, so bodies of
+    any size are streamed line by line instead of being loaded at once.
+    Decoding of every line is left to the consumer, which reports errors
+    per line.
+    """
+
+    media_type = 'application/x-ndjson'
+
+    def parse(
+        self,
+        stream: Any,
+        media_type: Optional[str] = None,
+        parser_context: Optional[dict[str, Any]] = None,
+    ) -> Iterator[bytes]:
+        return iter(stream.readline, b'')
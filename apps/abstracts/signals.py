@@ -0,0 +1,40 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.dispatch import Signal, receiver
+
+# Sent by SoftDeleteQuerySet after bulk soft deletes and restores, with
+# `pks` of the affected rows and `deleted` telling which of the two it was
+soft_delete_changed = Signal()
+
+SQLITE_PRAGMAS = {
+    # Readers and the writer stop blocking each other
+    'journal_mode': 'WAL',
+    # Durable across crashes of the process, fsync only on checkpoints
+    'synchronous': 'NORMAL',
+    # Negative size is in KiB, 64 MiB of page cache
+    'cache_size': -64000,
+    'mmap_size': 256 * 1024 * 1024,
+    # Milliseconds to wait for a lock before "database is locked"
+    'busy_timeout': 20000,
+    'temp_store': 'MEMORY',
+}
+
+
+@receiver(connection_created)
+def configure_sqlite_connection(
+    sender: type,
+    connection: BaseDatabaseWrapper,
+    **kwargs: dict[str, Any],
+) -> None:
+    """Tunes every new SQLite connection for concurrent reads and writes"""
+
+    if connection.vendor != 'sqlite':
+        return
+
+    with connection.cursor() as cursor:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
@@ -0,0 +1,125 @@
+# Python modules
+from collections import defaultdict
+from re import escape
+from uuid import uuid4
+
+# Django modules
+from django.db import connections
+from django.db.models import (
+    BigIntegerField,
+    Case,
+    Count,
+    Max,
+    Model,
+    Q,
+    QuerySet,
+    When,
+)
+from django.db.models.functions import Cast, Substr
+from django.utils.text import slugify
+
+# Longest numeric suffix that still casts to BigIntegerField everywhere.
+# Slugs with longer ones are left to random_suffixed_slug.
+SLUG_SUFFIX_PATTERN = r'-[0-9]{1,18}'
+SLUG_BATCH_SIZE = 200
+RANDOM_SUFFIX_LENGTH = 8
+
+
+def make_base_slug(value: str, model: type[Model]) -> str:
+    """
+    Returns the slugified value. Values that slugify to nothing, like
+    punctuation or Cyrillic only titles, fall back to the model name, so
+    they get `post`, `post-1`, ... instead of an empty slug and `-1`.
+    """
+
+    return slugify(value) or model._meta.model_name
+
+
+def suffixed_slugs_q(queryset: QuerySet, base_slug: str) -> Q:
+    """Returns filter matching `base_slug` and every `base_slug-...` slug"""
+
+    prefix = f'{base_slug}-'
+
+    if connections[queryset.db].vendor == 'sqlite':
+        # LIKE is case-insensitive in SQLite and can't use the slug index,
+        # while a range over the default BINARY collation can.
+        return Q(slug=base_slug) | Q(slug__gt=prefix, slug__lt=f'{base_slug}.')
+
+    return Q(slug=base_slug) | Q(slug__startswith=prefix)
+
+
+def next_available_slug(queryset: QuerySet, base_slug: str) -> str:
+    """
+    Returns `base_slug` or `base_slug-N` with N above the highest suffix
+    already taken, using a single aggregate query.
+    """
+
+    suffix_start = len(base_slug) + 2
+    suffixed = Q(slug__regex=rf'^{escape(base_slug)}{SLUG_SUFFIX_PATTERN}$')
+
+    taken = queryset.filter(
+        suffixed_slugs_q(queryset, base_slug),
+        Q(slug=base_slug) | suffixed,
+    ).aggregate(
+        base_taken=Count('pk', filter=Q(slug=base_slug)),
+        max_suffix=Max(
+            Case(
+                When(
+                    ~Q(slug=base_slug),
+                    then=Cast(Substr('slug', suffix_start), BigIntegerField()),
+                ),
+                output_field=BigIntegerField(),
+            )
+        ),
+    )
+
+    if not taken['base_taken']:
+        return base_slug
+
+    return f"{base_slug}-{(taken['max_suffix'] or 0) + 1}"
+
+
+def random_suffixed_slug(base_slug: str) -> str:
+    """Returns `base_slug` with a random suffix, for when computed ones keep clashing"""
+
+    return f'{base_slug}-{uuid4().hex[:RANDOM_SUFFIX_LENGTH]}'
+
+
+def allocate_slugs(queryset: QuerySet, base_slugs: list[str]) -> list[str]:
+    """
+    Returns a free slug for every base slug, unique against the table and
+    within the batch, reading taken slugs with one query per batch.
+    """
+
+    taken: set[str] = set()
+    max_suffix: defaultdict[str, int] = defaultdict(int)
+    unique_bases = list(dict.fromkeys(base_slugs))
+    requested = set(unique_bases)
+
+    for start in range(0, len(unique_bases), SLUG_BATCH_SIZE):
+        condition = Q()
+        for base_slug in unique_bases[start:start + SLUG_BATCH_SIZE]:
+            condition |= suffixed_slugs_q(queryset, base_slug)
+
+        for slug in queryset.filter(condition).values_list('slug', flat=True):
+            taken.add(slug)
+            # Only `base-N` of a requested base is a suffix, the number in
+            # `weekly-update-2024` is part of its own base
+            head, _, tail = slug.rpartition('-')
+            if head in requested and tail.isdigit():
+                max_suffix[head] = max(max_suffix[head], int(tail))
+
+    slugs = []
+    for base_slug in base_slugs:
+        slug = base_slug
+        if slug in taken:
+            suffix = max_suffix[base_slug] + 1
+            # Another base of the batch may already hold `base-N` verbatim
+            while f'{base_slug}-{suffix}' in taken:
+                suffix += 1
+            max_suffix[base_slug] = suffix
+            slug = f'{base_slug}-{suffix}'
+        taken.add(slug)
+        slugs.append(slug)
+
+    return slugs
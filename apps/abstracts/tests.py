@@ -1,3 +1,81 @@
-from django.test import TestCase
+# Python modules
+from datetime import datetime, timedelta, timezone
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import skipUnless
 
-# Create your tests here.
+# Django modules
+from babel.dates import format_datetime
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
+from django.template import engines
+from django.template.loaders.cached import Loader as CachedLoader
+from django.test import SimpleTestCase
+
+# Project modules
+from apps.abstracts.formatters import LocalDateTimeFormatter
+from apps.abstracts.signals import SQLITE_PRAGMAS
+from apps.abstracts.utils import WELCOME_TEMPLATE, warm_welcome_templates
+from apps.users.models import CustomUser
+
+
+class LocalDateTimeFormatterTests(SimpleTestCase):
+    """Output of the formatter against babel format_datetime"""
+
+    LANGUAGES = ('en', 'ru', 'kk')
+    TIMEZONES = ('UTC', 'Asia/Almaty', 'Europe/Moscow', 'America/New_York')
+
+    def test_matches_format_datetime(self) -> None:
+        start = datetime(2025, 1, 1, 0, 30, tzinfo=timezone.utc)
+        # A year of values, across midnight and both DST switches
+        values = [start + timedelta(hours=7 * step) for step in range(1300)]
+
+        for language in self.LANGUAGES:
+            for tz_name in self.TIMEZONES:
+                formatter = LocalDateTimeFormatter(language, tz_name)
+                with self.subTest(language=language, tz_name=tz_name):
+                    for value in values:
+                        self.assertEqual(
+                            formatter.format(value),
+                            format_datetime(value, format='long', tzinfo=tz_name, locale=language),
+                        )
+
+
+class WelcomeTemplateTests(SimpleTestCase):
+    """Welcome templates compiled ahead of the first sign-up"""
+
+    def test_warming_fills_cached_loader(self) -> None:
+        loader = engines['django'].engine.template_loaders[0]
+        self.assertIsInstance(loader, CachedLoader)
+        loader.reset()
+
+        warm_welcome_templates()
+
+        self.assertEqual(
+            set(loader.get_template_cache),
+            {WELCOME_TEMPLATE.format(lang=lang) for lang in CustomUser.LANGUAGE_CODES},
+        )
+
+
+@skipUnless(connection.vendor == 'sqlite', "Pragmas are only set on SQLite connections")
+class SQLiteConnectionTests(SimpleTestCase):
+    """Pragmas applied to new SQLite connections"""
+
+    def test_file_database_pragmas(self) -> None:
+        # The test database lives in memory, where WAL isn't available
+        with TemporaryDirectory() as directory:
+            database = SQLiteDatabaseWrapper(
+                {**connection.settings_dict, 'NAME': path.join(directory, 'pragmas.sqlite3')},
+                alias='pragmas',
+            )
+            try:
+                with database.cursor() as cursor:
+                    cursor.execute('PRAGMA journal_mode')
+                    journal_mode = cursor.fetchone()[0]
+                    cursor.execute('PRAGMA busy_timeout')
+                    busy_timeout = cursor.fetchone()[0]
+            finally:
+                database.close()
+
+        self.assertEqual(journal_mode.upper(), SQLITE_PRAGMAS['journal_mode'])
+        self.assertEqual(busy_timeout, SQLITE_PRAGMAS['busy_timeout'])
@@ -1,24 +1,35 @@
-from django.template.loader import render_to_string
-from django.core.mail import send_mail
+from django.template.loader import get_template, render_to_string
 from django.utils.translation import gettext_lazy as _
 
 
 from settings.base import HOME_PAGE_URL
 from apps.users.models import CustomUser 
+from apps.notifications.models import OutgoingEmail
 
-def send_welcome_email(user: CustomUser) -> None:
-    """Sends welcome Email on Users preferred language"""
+WELCOME_TEMPLATE = 'welcome/{lang}.html'
+
+def warm_welcome_templates() -> None:
+    """Compiles welcome templates of every language into the cached loader"""
+    for lang in CustomUser.LANGUAGE_CODES:
+        get_template(WELCOME_TEMPLATE.format(lang=lang))
+
+def send_welcome_email(user: CustomUser) -> OutgoingEmail:
+    """
+    Queues welcome Email on Users preferred language.
+
+    Call it in the transaction creating the user, the outbox delivers it
+    once the transaction commits.
+    """
     lang = user.preferred_language
 
-    html = render_to_string(f'welcome/{lang}.html', {
+    html = render_to_string(WELCOME_TEMPLATE.format(lang=lang), {
         'user_name': user,
         'site_url': HOME_PAGE_URL
     })
 
-    send_mail(
-        subject=_('Welcome'),
-        message='',
+    return OutgoingEmail.objects.create(
+        subject=str(_('Welcome')),
         html_message=html,
         from_email='noreply@blog.kz',
-        recipient_list=[user.email]
-    )
\ No newline at end of file
+        recipient=user.email,
+    )
@@ -0,0 +1,284 @@
+# Python modules
+from datetime import datetime
+from hashlib import md5
+from threading import Lock
+from time import monotonic
+from typing import Any, Iterable, Optional
+from uuid import uuid4
+
+# Django modules
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse, QueryDict
+from rest_framework.renderers import JSONRenderer
+
+# Project modules
+from apps.blog.models import CategoryTranslations, Post
+from apps.abstracts.conditional import get_not_modified_response, set_validator_headers
+
+
+LIVE_POST_KEY = 'blog:posts:live:{slug}'
+LIVE_POST_TIMEOUT = 30
+
+
+def get_version(key: str) -> str:
+    """Returns version token stored under the key, creating it if missing"""
+
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def aget_version(key: str) -> str:
+    """Async version of get_version"""
+
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, uuid4().hex, timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+class CategoryNameCache:
+    """
+    Process-local lookup of (category_id, language) -> translated name.
+
+    The lookup is built lazily from a single query and shared by every
+    serializer in the process. A version token stored in the Django cache
+    lets workers notice that another process invalidated its copy.
+    """
+
+    VERSION_KEY = 'blog:category-names:version'
+    VERSION_CHECK_INTERVAL = 5.0
+
+    def __init__(self) -> None:
+        self._names: Optional[dict[tuple[int, str], str]] = None
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+        self._lock = Lock()
+
+    def get_names(self) -> dict[tuple[int, str], str]:
+        """Returns the whole lookup, rebuilding it when it is stale"""
+
+        now = monotonic()
+        names = self._names
+
+        if names is not None and now - self._checked_at < self.VERSION_CHECK_INTERVAL:
+            return names
+
+        with self._lock:
+            version = get_version(self.VERSION_KEY)
+            if self._names is None or version != self._version:
+                self._names = self._load()
+                self._version = version
+            self._checked_at = now
+            return self._names
+
+    async def aget_names(self) -> dict[tuple[int, str], str]:
+        """Async version of get_names"""
+
+        now = monotonic()
+        names = self._names
+
+        if names is not None and now - self._checked_at < self.VERSION_CHECK_INTERVAL:
+            return names
+
+        version = await aget_version(self.VERSION_KEY)
+
+        if names is None or version != self._version:
+            names = {
+                (category_id, language): name
+                async for category_id, language, name in self._get_rows()
+            }
+            with self._lock:
+                self._names = names
+                self._version = version
+
+        self._checked_at = now
+        return names
+
+    def invalidate(self) -> None:
+        """Drops local lookup and tells other processes to drop theirs"""
+
+        with self._lock:
+            self._names = None
+            self._version = None
+        cache.set(self.VERSION_KEY, uuid4().hex, timeout=None)
+
+    def invalidate_on_commit(self) -> None:
+        """Invalidates once the current transaction commits, see PostResponseCache"""
+
+        transaction.on_commit(self.invalidate)
+
+    @staticmethod
+    def _get_rows() -> QuerySet:
+        return CategoryTranslations.objects.values_list('orig_category_id', 'language', 'name')
+
+    def _load(self) -> dict[tuple[int, str], str]:
+        return {(category_id, language): name for category_id, language, name in self._get_rows()}
+
+
+category_names = CategoryNameCache()
+
+
+class PostResponseCache:
+    """
+    Read-through cache of rendered post list and detail responses.
+
+    Entries are keyed by endpoint, slug, query string, language and viewer
+    timezone, and live under a version token of the list or of the post.
+    Invalidation drops the tokens, so stale entries are never read again
+    and simply expire. Entries keep the ETag and Last-Modified computed
+    for them, so cached revalidations are answered without a query.
+
+    Writers invalidate on commit: a token dropped earlier could be taken
+    again by a reader that still sees the old rows, and its entry would
+    live under the new token until it expires.
+    """
+
+    LIST_VERSION_KEY = 'blog:posts:list:version'
+    POST_VERSION_KEY = 'blog:posts:post:{slug}:version'
+    RESPONSE_KEY = 'blog:posts:response:{version}:{digest}'
+    TIMEOUT = 300
+
+    def get_key(
+        self,
+        query: QueryDict,
+        language: str,
+        tz_name: str,
+        slug: Optional[str] = None,
+    ) -> str:
+        """Returns cache key of the response"""
+
+        version = get_version(self._get_version_key(slug))
+        return self._build_key(version, query, language, tz_name, slug)
+
+    async def aget_key(
+        self,
+        query: QueryDict,
+        language: str,
+        tz_name: str,
+        slug: Optional[str] = None,
+    ) -> str:
+        """Async version of get_key"""
+
+        version = await aget_version(self._get_version_key(slug))
+        return self._build_key(version, query, language, tz_name, slug)
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        return cache.get(key)
+
+    async def aget(self, key: str) -> Optional[dict[str, Any]]:
+        return await cache.aget(key)
+
+    def set(
+        self,
+        key: str,
+        data: Any,
+        etag: Optional[str],
+        last_modified: Optional[datetime],
+    ) -> dict[str, Any]:
+        """Renders and stores response data, returns the stored entry"""
+
+        entry = self._build_entry(data, etag, last_modified)
+        cache.set(key, entry, self.TIMEOUT)
+        return entry
+
+    async def aset(
+        self,
+        key: str,
+        data: Any,
+        etag: Optional[str],
+        last_modified: Optional[datetime],
+    ) -> dict[str, Any]:
+        """Async version of set"""
+
+        entry = self._build_entry(data, etag, last_modified)
+        await cache.aset(key, entry, self.TIMEOUT)
+        return entry
+
+    def invalidate(self, slugs: Iterable[str] = ()) -> None:
+        """Drops cached list pages and details of the given posts"""
+
+        cache.delete_many([
+            self.LIST_VERSION_KEY,
+            *(self.POST_VERSION_KEY.format(slug=slug) for slug in slugs),
+        ])
+
+    def invalidate_on_commit(self, slugs: Iterable[str] = ()) -> None:
+        """Invalidates once the current transaction commits"""
+
+        slugs = list(slugs)
+        transaction.on_commit(lambda: self.invalidate(slugs))
+
+    @staticmethod
+    def build_response(request: HttpRequest, entry: dict[str, Any]) -> HttpResponse:
+        """Returns the cached response, or 304 when client's copy is current"""
+
+        not_modified = get_not_modified_response(request, entry['etag'], entry['last_modified'])
+        if not_modified is not None:
+            return not_modified
+
+        response = HttpResponse(entry['body'], content_type='application/json')
+        return set_validator_headers(response, entry['etag'], entry['last_modified'])
+
+    def _get_version_key(self, slug: Optional[str]) -> str:
+        if slug is None:
+            return self.LIST_VERSION_KEY
+        return self.POST_VERSION_KEY.format(slug=slug)
+
+    def _build_key(
+        self,
+        version: str,
+        query: QueryDict,
+        language: str,
+        tz_name: str,
+        slug: Optional[str],
+    ) -> str:
+        raw = repr((slug, sorted(query.lists()), language, tz_name))
+        digest = md5(raw.encode('utf-8')).hexdigest()
+        return self.RESPONSE_KEY.format(version=version, digest=digest)
+
+    @staticmethod
+    def _build_entry(
+        data: Any,
+        etag: Optional[str],
+        last_modified: Optional[datetime],
+    ) -> dict[str, Any]:
+        return {
+            'body': JSONRenderer().render(data),
+            'etag': etag,
+            'last_modified': last_modified,
+        }
+
+
+post_responses = PostResponseCache()
+
+
+async def ais_post_live(slug: str) -> bool:
+    """Tells whether a not deleted post has the slug, caching the answer"""
+
+    key = LIVE_POST_KEY.format(slug=slug)
+    live: Optional[bool] = await cache.aget(key)
+
+    if live is None:
+        live = await Post.objects.filter(slug=slug).aexists()
+        await cache.aset(key, live, LIVE_POST_TIMEOUT)
+
+    return live
+
+
+def forget_posts_live_on_commit(slugs: Iterable[str]) -> None:
+    """Drops the cached liveness of the posts once the current transaction commits"""
+
+    slugs = list(slugs)
+    transaction.on_commit(lambda: forget_posts_live(slugs))
+
+
+def forget_posts_live(slugs: Iterable[str]) -> None:
+    """Drops the cached liveness of many posts at once"""
+
+    cache.delete_many([LIVE_POST_KEY.format(slug=slug) for slug in slugs])
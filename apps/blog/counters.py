@@ -0,0 +1,120 @@
+# Python modules
+from datetime import datetime
+from typing import Iterable
+
+# Django modules
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+# Project modules
+from apps.blog.models import Category, Comment, Post, Tag
+from apps.blog.caches import post_responses
+
+
+def comment_added(post: Post, created_at: datetime) -> None:
+    """Counts a new comment of the post, call it in the inserting transaction"""
+
+    Post.all_objects.filter(pk=post.pk).update(
+        comment_count=F('comment_count') + 1,
+        last_comment_at=Greatest(Coalesce('last_comment_at', Value(created_at)), Value(created_at)),
+    )
+    post_responses.invalidate_on_commit([post.slug])
+
+
+def comment_removed(post: Post) -> None:
+    """Uncounts a soft deleted comment of the post, call it in the deleting transaction"""
+
+    Post.all_objects.filter(pk=post.pk).update(
+        # Rows created around the model, like bulk_create, aren't counted
+        comment_count=Greatest(F('comment_count') - 1, Value(0)),
+        last_comment_at=get_last_comment_subquery(),
+    )
+    post_responses.invalidate_on_commit([post.slug])
+
+
+def recount_comments(post_ids: Iterable[int]) -> int:
+    """Recomputes counters of the posts from their comments with one UPDATE"""
+
+    return Post.all_objects.filter(pk__in=list(post_ids)).update(
+        comment_count=Coalesce(get_comment_count_subquery(), 0),
+        last_comment_at=get_last_comment_subquery(),
+    )
+
+
+def recount_tag_posts(tag_ids: Iterable[int]) -> int:
+    """Recomputes published post counts of the tags with one UPDATE"""
+
+    return Tag.all_objects.filter(pk__in=list(tag_ids)).update(
+        published_post_count=Coalesce(get_tag_post_count_subquery(), 0),
+    )
+
+
+def recount_category_posts(category_ids: Iterable[int]) -> int:
+    """Recomputes published post counts of the categories with one UPDATE"""
+
+    return Category.all_objects.filter(pk__in=list(category_ids)).update(
+        published_post_count=Coalesce(get_category_post_count_subquery(), 0),
+    )
+
+
+def recount_post_taxonomy(post_ids: Iterable[int], category_ids: Iterable[int] = ()) -> None:
+    """
+    Recounts tags and categories of the posts. Pass former categories of
+    posts that moved, those lost a post too.
+    """
+
+    post_ids = list(post_ids)
+    tag_ids = set(
+        Post.tags.through.objects.filter(post_id__in=post_ids).values_list('tag_id', flat=True)
+    )
+    category_ids = set(category_ids) | set(
+        Post.all_objects.filter(pk__in=post_ids, category__isnull=False)
+        .values_list('category_id', flat=True)
+    )
+
+    if tag_ids:
+        recount_tag_posts(tag_ids)
+    if category_ids:
+        recount_category_posts(category_ids)
+
+
+def get_comment_count_subquery() -> Subquery:
+    return Subquery(
+        Comment.objects.filter(post_id=OuterRef('pk'))
+        .order_by()
+        .values('post_id')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+
+
+def get_last_comment_subquery() -> Subquery:
+    return Subquery(
+        Comment.objects.filter(post_id=OuterRef('pk'))
+        .order_by('-created_at')
+        .values('created_at')[:1]
+    )
+
+
+def get_tag_post_count_subquery() -> Subquery:
+    return Subquery(
+        Post.tags.through.objects.filter(
+            tag_id=OuterRef('pk'),
+            post__status=Post.STATUS_PUBLISHED,
+            post__deleted_at__isnull=True,
+        )
+        .order_by()
+        .values('tag_id')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+
+
+def get_category_post_count_subquery() -> Subquery:
+    return Subquery(
+        Post.objects.filter(category_id=OuterRef('pk'), status=Post.STATUS_PUBLISHED)
+        .order_by()
+        .values('category_id')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
@@ -0,0 +1,148 @@
+# Python modules
+from datetime import datetime, time
+from typing import Any, Optional
+
+# Django modules
+from django.db.models import Exists, OuterRef, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.request import Request as DRFRequest
+
+# Project modules
+from apps.blog.models import Post
+
+
+class PostFilterBackend(BaseFilterBackend):
+    """
+    Filters posts by tags, category, author and creation date.
+
+    `tag` takes tag slugs and can be repeated; with `tag_mode=all` posts
+    need every tag, otherwise any of them. Tags are matched with EXISTS
+    over the tags through table, so posts never need to be de-duplicated.
+    Date bounds take ISO dates or datetimes, a bare date means its
+    midnight; `created_after` is inclusive, `created_before` exclusive.
+    """
+
+    tag_param = 'tag'
+    tag_mode_param = 'tag_mode'
+    category_param = 'category'
+    author_param = 'author'
+    created_after_param = 'created_after'
+    created_before_param = 'created_before'
+    tag_modes = ('any', 'all')
+    # Detail routes look posts up by slug alone
+    filtered_actions = ('list', 'search')
+
+    def filter_queryset(self, request: DRFRequest, queryset: QuerySet, view: Any = None) -> QuerySet:
+        if view is not None and getattr(view, 'action', None) not in self.filtered_actions:
+            return queryset
+
+        params = request.query_params
+
+        tags = [slug for slug in params.getlist(self.tag_param) if slug]
+        tag_mode = self.get_tag_mode(params)
+        if tags:
+            queryset = self.filter_tags(queryset, tags, tag_mode)
+
+        category = params.get(self.category_param)
+        if category:
+            queryset = queryset.filter(category__slug=category)
+
+        author = params.get(self.author_param)
+        if author:
+            queryset = queryset.filter(author_id=self.get_author_id(author))
+
+        created_after = self.get_datetime(params, self.created_after_param)
+        if created_after is not None:
+            queryset = queryset.filter(created_at__gte=created_after)
+
+        created_before = self.get_datetime(params, self.created_before_param)
+        if created_before is not None:
+            queryset = queryset.filter(created_at__lt=created_before)
+
+        return queryset
+
+    @staticmethod
+    def filter_tags(queryset: QuerySet, slugs: list[str], mode: str) -> QuerySet:
+        tagged = Post.tags.through.objects.filter(
+            post_id=OuterRef('pk'),
+            tag__deleted_at__isnull=True,
+        )
+
+        if mode == 'any':
+            return queryset.filter(Exists(tagged.filter(tag__slug__in=slugs)))
+
+        for slug in dict.fromkeys(slugs):
+            queryset = queryset.filter(Exists(tagged.filter(tag__slug=slug)))
+        return queryset
+
+    def get_tag_mode(self, params: Any) -> str:
+        mode = params.get(self.tag_mode_param, 'any')
+        if mode not in self.tag_modes:
+            raise ValidationError({self.tag_mode_param: _("Must be 'any' or 'all'.")})
+        return mode
+
+    def get_author_id(self, value: str) -> int:
+        try:
+            return int(value)
+        except ValueError:
+            raise ValidationError({self.author_param: _("Must be an integer id.")})
+
+    @staticmethod
+    def get_datetime(params: Any, name: str) -> Optional[datetime]:
+        value = params.get(name)
+        if not value:
+            return None
+
+        try:
+            parsed = parse_datetime(value)
+            if parsed is None:
+                date = parse_date(value)
+                parsed = datetime.combine(date, time.min) if date else None
+        except ValueError:
+            parsed = None
+
+        if parsed is None:
+            raise ValidationError({name: _("Must be an ISO 8601 date or datetime.")})
+
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def get_schema_operation_parameters(self, view: Any) -> list[dict[str, Any]]:
+        def parameter(name: str, description: str, schema: dict[str, Any]) -> dict[str, Any]:
+            return {
+                'name': name,
+                'required': False,
+                'in': 'query',
+                'description': description,
+                'schema': schema,
+            }
+
+        return [
+            parameter(
+                self.tag_param,
+                'Tag slug, repeat for several tags.',
+                {'type': 'array', 'items': {'type': 'string'}},
+            ),
+            parameter(
+                self.tag_mode_param,
+                'Whether posts need any or all of the tags.',
+                {'type': 'string', 'enum': list(self.tag_modes), 'default': 'any'},
+            ),
+            parameter(self.category_param, 'Category slug.', {'type': 'string'}),
+            parameter(self.author_param, 'Author id.', {'type': 'integer'}),
+            parameter(
+                self.created_after_param,
+                'Posts created at or after this date or datetime.',
+                {'type': 'string', 'format': 'date-time'},
+            ),
+            parameter(
+                self.created_before_param,
+                'Posts created before this date or datetime.',
+                {'type': 'string', 'format': 'date-time'},
+            ),
+        ]
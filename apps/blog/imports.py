@@ -0,0 +1,282 @@
+# Python modules
+from itertools import islice
+from json import loads
+from operator import itemgetter
+from typing import Any, Iterable, Optional
+
+# Django modules
+from django.db import IntegrityError, transaction
+from django.utils.translation import gettext as _
+from rest_framework.exceptions import ValidationError
+
+# Project modules
+from apps.abstracts.slugs import allocate_slugs, make_base_slug
+from apps.blog.caches import forget_posts_live_on_commit, post_responses
+from apps.blog.counters import recount_category_posts, recount_tag_posts
+from apps.blog.models import Category, Post, Tag
+from apps.blog.serializer import PostImportRowSerializer
+from apps.users.models import CustomUser
+
+IMPORT_CHUNK_SIZE = 1000
+RECOUNT_BATCH_SIZE = 500
+SLUG_MAX_ATTEMPTS = 5
+
+
+class ImportReport:
+    """Number of imported posts and the errors of rejected lines"""
+
+    def __init__(self) -> None:
+        self.imported = 0
+        self.errors: list[dict[str, Any]] = []
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    def add_error(self, line: int, errors: Any) -> None:
+        self.errors.append({'line': line, 'errors': errors})
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'imported': self.imported,
+            'failed': self.failed,
+            'errors': self.errors,
+        }
+
+
+class PostImporter:
+    """
+    Imports posts from NDJSON lines, one JSON object per line.
+
+    Lines are handled in chunks. Authors, categories and tags of a chunk
+    are resolved with a few queries, slugs are allocated for the whole
+    chunk, and posts with their tag links are inserted with bulk_create in
+    one transaction per chunk. Rejected lines are reported and skipped.
+
+    bulk_create sends no signals, so tag and category counters and the
+    post list cache are refreshed once when the import ends.
+    """
+
+    def __init__(
+        self,
+        default_author: Optional[CustomUser] = None,
+        allow_author: bool = True,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Rows without `author` are written by `default_author`. Unless
+        `allow_author` is set, rows can't name anybody else.
+        """
+
+        self.default_author = default_author
+        self.allow_author = allow_author
+        self.chunk_size = chunk_size
+
+        # Lookups shared by every chunk, None marks names that don't exist
+        self._author_ids: dict[str, Optional[int]] = {}
+        self._category_ids: dict[str, Optional[int]] = {}
+        self._tag_ids: dict[str, int] = {}
+
+        self._counted_tag_ids: set[int] = set()
+        self._counted_category_ids: set[int] = set()
+
+    def run(self, lines: Iterable[bytes | str]) -> ImportReport:
+        """Imports every line and returns the report"""
+
+        report = ImportReport()
+        numbered = enumerate(lines, start=1)
+
+        try:
+            while chunk := list(islice(numbered, self.chunk_size)):
+                self.import_chunk(chunk, report)
+            # Rows rejected at resolution come after the ones rejected at parsing
+            report.errors.sort(key=itemgetter('line'))
+        finally:
+            # Chunks committed before a failure are live already
+            if report.imported:
+                self.refresh_counters()
+
+        return report
+
+    def import_chunk(self, chunk: list[tuple[int, bytes | str]], report: ImportReport) -> None:
+        rows = self.validate(chunk, report)
+        rows = self.resolve_relations(rows, report)
+        if not rows:
+            return
+
+        posts = [post for number, post, tag_ids in rows]
+        links = [tag_ids for number, post, tag_ids in rows]
+        self.insert(posts, links)
+
+        report.imported += len(posts)
+        forget_posts_live_on_commit(post.slug for post in posts)
+
+        for post, tag_ids in zip(posts, links):
+            if post.status == Post.STATUS_PUBLISHED:
+                self._counted_tag_ids.update(tag_ids)
+                if post.category_id is not None:
+                    self._counted_category_ids.add(post.category_id)
+
+    def validate(
+        self,
+        chunk: list[tuple[int, bytes | str]],
+        report: ImportReport,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Decodes and validates the lines, blank lines are skipped"""
+
+        rows = []
+        # Like ListSerializer, one instance validates every row, so its
+        # fields are built once instead of once per row
+        serializer = PostImportRowSerializer()
+
+        for number, line in chunk:
+            if not line.strip():
+                continue
+
+            try:
+                data = loads(line)
+            except ValueError as error:
+                report.add_error(number, {'non_field_errors': [_("Invalid JSON: %s") % error]})
+                continue
+
+            if not isinstance(data, dict):
+                report.add_error(number, {'non_field_errors': [_("Expected a JSON object.")]})
+                continue
+
+            try:
+                rows.append((number, serializer.run_validation(data)))
+            except ValidationError as error:
+                report.add_error(number, error.detail)
+
+        return rows
+
+    def resolve_relations(
+        self,
+        rows: list[tuple[int, dict[str, Any]]],
+        report: ImportReport,
+    ) -> list[tuple[int, Post, list[int]]]:
+        """Builds unsaved posts, rejecting rows with unknown authors or categories"""
+
+        self._load_missing(
+            self._author_ids,
+            CustomUser.objects,
+            'email',
+            [data['author'] for number, data in rows if data.get('author')],
+        )
+        self._load_missing(
+            self._category_ids,
+            Category.objects,
+            'name',
+            [data['category'] for number, data in rows if data.get('category')],
+        )
+
+        accepted = []
+        for number, data in rows:
+            errors = {}
+            author_id = self._get_author_id(data.get('author'), errors)
+            category_id = None
+
+            if data.get('category'):
+                category_id = self._category_ids[data['category']]
+                if category_id is None:
+                    errors['category'] = [_("Category '%s' does not exist") % data['category']]
+
+            if errors:
+                report.add_error(number, errors)
+                continue
+
+            post = Post(
+                author_id=author_id,
+                category_id=category_id,
+                title=data['title'],
+                body=data['body'],
+                status=data['status'],
+            )
+            accepted.append((number, post, data['tags']))
+
+        missing_tags = list(dict.fromkeys(
+            name for number, post, names in accepted for name in names if name not in self._tag_ids
+        ))
+        if missing_tags:
+            for tag in Tag.objects.resolve(missing_tags):
+                self._tag_ids[tag.name] = tag.pk
+
+        return [
+            (number, post, list(dict.fromkeys(self._tag_ids[name] for name in names)))
+            for number, post, names in accepted
+        ]
+
+    def insert(self, posts: list[Post], links: list[list[int]]) -> None:
+        """
+        Inserts the posts and their tag links in one transaction. Slugs
+        taken by a concurrent writer meanwhile are allocated again.
+        """
+
+        base_slugs = [make_base_slug(post.title, Post) for post in posts]
+        Link = Post.tags.through
+
+        for attempt in range(SLUG_MAX_ATTEMPTS):
+            slugs = allocate_slugs(Post._base_manager.all(), base_slugs)
+            for post, slug in zip(posts, slugs):
+                post.pk = None
+                post.slug = slug
+
+            try:
+                with transaction.atomic():
+                    Post.objects.bulk_create(posts)
+                    Link.objects.bulk_create([
+                        Link(post_id=post.pk, tag_id=tag_id)
+                        for post, tag_ids in zip(posts, links)
+                        for tag_id in tag_ids
+                    ])
+                return
+            except IntegrityError:
+                slugs_taken = Post._base_manager.filter(slug__in=slugs).exists()
+                if not slugs_taken or attempt == SLUG_MAX_ATTEMPTS - 1:
+                    raise
+
+    def refresh_counters(self) -> None:
+        """Recounts tags and categories that got published posts, drops list cache"""
+
+        tag_ids = list(self._counted_tag_ids)
+        for start in range(0, len(tag_ids), RECOUNT_BATCH_SIZE):
+            recount_tag_posts(tag_ids[start:start + RECOUNT_BATCH_SIZE])
+
+        category_ids = list(self._counted_category_ids)
+        for start in range(0, len(category_ids), RECOUNT_BATCH_SIZE):
+            recount_category_posts(category_ids[start:start + RECOUNT_BATCH_SIZE])
+
+        post_responses.invalidate_on_commit()
+
+    def _get_author_id(self, email: Optional[str], errors: dict[str, Any]) -> Optional[int]:
+        if not email:
+            if self.default_author is None:
+                errors['author'] = [_("This field is required.")]
+                return None
+            return self.default_author.pk
+
+        if not self.allow_author and email != getattr(self.default_author, 'email', None):
+            errors['author'] = [_("You can only import your own posts.")]
+            return None
+
+        author_id = self._author_ids[email]
+        if author_id is None:
+            errors['author'] = [_("Author '%s' does not exist") % email]
+        return author_id
+
+    @staticmethod
+    def _load_missing(
+        known: dict[str, Optional[int]],
+        manager: Any,
+        field_name: str,
+        values: list[str],
+    ) -> None:
+        """Looks up ids of values not seen before with one query"""
+
+        missing = [value for value in dict.fromkeys(values) if value not in known]
+        if not missing:
+            return
+
+        found = dict(manager.filter(**{f'{field_name}__in': missing}).values_list(field_name, 'pk'))
+        for value in missing:
+            known[value] = found.get(value)
@@ -0,0 +1,47 @@
+# Python modules
+import sys
+from json import dumps
+from typing import Any
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+# Project modules
+from apps.blog.imports import IMPORT_CHUNK_SIZE, PostImporter
+from apps.users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = "Imports posts from a file of newline delimited JSON objects"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('path', help="NDJSON file, '-' reads standard input")
+        parser.add_argument(
+            '--author',
+            help="Email of the author of rows that don't name one",
+        )
+        parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        default_author = None
+        if options['author']:
+            default_author = CustomUser.objects.filter(email=options['author']).first()
+            if default_author is None:
+                raise CommandError(f"Author '{options['author']}' does not exist")
+
+        importer = PostImporter(default_author=default_author, chunk_size=options['chunk_size'])
+
+        if options['path'] == '-':
+            report = importer.run(sys.stdin.buffer)
+        else:
+            try:
+                with open(options['path'], 'rb') as lines:
+                    report = importer.run(lines)
+            except OSError as error:
+                raise CommandError(error)
+
+        # One JSON object per rejected line, same shape as the API report
+        for error in report.errors:
+            self.stderr.write(dumps(error, ensure_ascii=False))
+
+        self.stdout.write(f"Imported posts: {report.imported}, rejected lines: {report.failed}")
@@ -0,0 +1,105 @@
+# Python modules
+from typing import Any, Callable, Iterable
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+
+# Project modules
+from apps.blog.caches import post_responses
+from apps.blog.counters import (
+    get_category_post_count_subquery,
+    get_comment_count_subquery,
+    get_last_comment_subquery,
+    get_tag_post_count_subquery,
+    recount_category_posts,
+    recount_comments,
+    recount_tag_posts,
+)
+from apps.blog.models import Category, Post, Tag
+
+
+class Command(BaseCommand):
+    help = "Recomputes denormalized counters that drifted from the rows they count"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        repaired = self.reconcile_post_comments(options['batch_size'])
+        self.stdout.write(f"Posts with repaired comment counters: {repaired}")
+
+        repaired = self.reconcile_post_counts(
+            Tag, get_tag_post_count_subquery, recount_tag_posts, options['batch_size'],
+        )
+        self.stdout.write(f"Tags with repaired post counters: {repaired}")
+
+        repaired = self.reconcile_post_counts(
+            Category, get_category_post_count_subquery, recount_category_posts, options['batch_size'],
+        )
+        self.stdout.write(f"Categories with repaired post counters: {repaired}")
+
+    @staticmethod
+    def reconcile_post_comments(batch_size: int) -> int:
+        """
+        Walks posts in id order; per batch, one query finds the drifted
+        posts and one UPDATE recounts them.
+        """
+
+        repaired = 0
+        last_pk = 0
+
+        while True:
+            rows = list(
+                Post.all_objects.filter(pk__gt=last_pk).order_by('pk').annotate(
+                    actual_count=Coalesce(get_comment_count_subquery(), 0),
+                    actual_last=get_last_comment_subquery(),
+                ).values_list(
+                    'pk', 'slug', 'comment_count', 'last_comment_at', 'actual_count', 'actual_last',
+                )[:batch_size]
+            )
+            if not rows:
+                return repaired
+            last_pk = rows[-1][0]
+
+            drifted = {
+                pk: slug
+                for pk, slug, count, last, actual_count, actual_last in rows
+                if (count, last) != (actual_count, actual_last)
+            }
+            if not drifted:
+                continue
+
+            with transaction.atomic():
+                recount_comments(drifted)
+            post_responses.invalidate(drifted.values())
+            repaired += len(drifted)
+
+    @staticmethod
+    def reconcile_post_counts(
+        model: type[Tag | Category],
+        get_subquery: Callable[[], Subquery],
+        recount: Callable[[Iterable[int]], int],
+        batch_size: int,
+    ) -> int:
+        """Same walk as reconcile_post_comments, for published post counts"""
+
+        repaired = 0
+        last_pk = 0
+
+        while True:
+            rows = list(
+                model.all_objects.filter(pk__gt=last_pk).order_by('pk').annotate(
+                    actual_count=Coalesce(get_subquery(), 0),
+                ).values_list('pk', 'published_post_count', 'actual_count')[:batch_size]
+            )
+            if not rows:
+                return repaired
+            last_pk = rows[-1][0]
+
+            drifted = [pk for pk, count, actual_count in rows if count != actual_count]
+            if drifted:
+                recount(drifted)
+                repaired += len(drifted)
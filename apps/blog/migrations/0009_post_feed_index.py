@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-18 17:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_alter_comment_author_alter_comment_post'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['status', 'deleted_at', 'created_at', 'id'], name='blog_post_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-18 17:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_post_feed_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'deleted_at', 'created_at', 'id'], name='blog_comment_post_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-18 17:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_comment_post_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='tag',
+            options={'default_manager_name': 'objects'},
+        ),
+        migrations.RemoveIndex(
+            model_name='comment',
+            name='blog_comment_post_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='blog_post_feed_idx',
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['post', 'created_at', 'id'], name='blog_comment_alive_post_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['status', 'created_at', 'id'], name='blog_post_alive_feed_idx'),
+        ),
+    ]
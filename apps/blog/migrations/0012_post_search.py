@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:05
+
+from django.db import migrations
+
+from apps.blog.search import install_search_index, uninstall_search_index
+
+
+def create_search_index(apps, schema_editor):
+    install_search_index(schema_editor, apps.get_model('blog', 'Post'))
+
+
+def drop_search_index(apps, schema_editor):
+    uninstall_search_index(schema_editor, apps.get_model('blog', 'Post'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_alive_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
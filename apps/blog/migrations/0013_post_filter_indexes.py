@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-18 17:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0012_post_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['author', 'status', 'created_at', 'id'], name='blog_post_author_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['category', 'status', 'created_at', 'id'], name='blog_post_category_feed_idx'),
+        ),
+    ]
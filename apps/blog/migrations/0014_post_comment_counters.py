@@ -0,0 +1,42 @@
+# Generated by Django 6.0.1 on 2026-10-18 17:58
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_comments(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+
+    alive_comments = Comment.objects.filter(post_id=OuterRef('pk'), deleted_at__isnull=True)
+    Post.objects.update(
+        comment_count=Coalesce(
+            Subquery(
+                alive_comments.order_by().values('post_id').annotate(count=Count('pk')).values('count')
+            ),
+            0,
+        ),
+        last_comment_at=Subquery(alive_comments.order_by('-created_at').values('created_at')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_post_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='last_comment_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(count_comments, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:00
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_posts(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    Tag = apps.get_model('blog', 'Tag')
+    Category = apps.get_model('blog', 'Category')
+
+    published = {'post__status': 'pub', 'post__deleted_at__isnull': True}
+    tagged = Post.tags.through.objects.filter(tag_id=OuterRef('pk'), **published)
+    Tag.objects.update(
+        published_post_count=Coalesce(
+            Subquery(tagged.order_by().values('tag_id').annotate(count=Count('pk')).values('count')),
+            0,
+        ),
+    )
+
+    categorized = Post.objects.filter(category_id=OuterRef('pk'), status='pub', deleted_at__isnull=True)
+    Category.objects.update(
+        published_post_count=Coalesce(
+            Subquery(
+                categorized.order_by().values('category_id').annotate(count=Count('pk')).values('count')
+            ),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_post_comment_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='published_post_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='published_post_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(count_posts, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,8 @@
 # Python modules
-from typing import Any
+from typing import Any, Iterable, Optional
 
 # Django modules
-from django.db import models
+from django.db import models, transaction
 from django.db.models import (
     CharField,
     SlugField,
@@ -10,16 +10,18 @@ from django.db.models import (
     TextField,
     ManyToManyField,
     DateTimeField,
+    PositiveIntegerField,
+    Q,
     CASCADE,
     SET_NULL,
 )
-from django.utils.text import slugify
 
 # Project modules
-from apps.abstracts.models import AbstractBaseModel
+from apps.abstracts.models import AbstractBaseModel, AliveManager, SlugAllocationMixin
+from apps.abstracts.slugs import allocate_slugs, make_base_slug
 from apps.users.models import CustomUser
 
-class Category(AbstractBaseModel):
+class Category(SlugAllocationMixin, AbstractBaseModel):
     """
     Category model represents category of blog 
     """
@@ -28,6 +30,8 @@ class Category(AbstractBaseModel):
 
     name = CharField(max_length=NAME_MAX_LEN, unique=True)
     slug = SlugField(unique=True, blank=True)
+    # Denormalized from live published posts, see apps.blog.counters
+    published_post_count = PositiveIntegerField(default=0)
 
     def __str__(self) -> str:
         """Returns the string representation of the category"""
@@ -36,17 +40,6 @@ class Category(AbstractBaseModel):
     def __repr__(self) -> str:
         """Returns the official string representation of the object."""
         return f"Category(id={self.id}, name={self.name}, slug={self.slug})"
-    
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.name)
-            slug = base_slug
-            counter = 1
-            while Category.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
 
 class CategoryTranslations(AbstractBaseModel):
     """
@@ -63,7 +56,45 @@ class CategoryTranslations(AbstractBaseModel):
         """Returns the string representation of the translation category"""
         return f"{self.orig_category}-{self.name}"
     
-class Tag(AbstractBaseModel):
+class TagManager(AliveManager):
+    """Manager for Tag model"""
+
+    def resolve(self, names: list[str]) -> list['Tag']:
+        """
+        Returns tags with the given names, creating missing ones, in a
+        constant number of queries regardless of how many names are given.
+
+        Names are unique among soft deleted tags too, so those are looked
+        up as well and brought back.
+        """
+
+        every_tag = self.model.all_objects
+        names = list(dict.fromkeys(names))
+        tags = {tag.name: tag for tag in every_tag.filter(name__in=names)}
+        missing = [name for name in names if name not in tags]
+
+        deleted = [tag.pk for tag in tags.values() if tag.deleted_at is not None]
+        if deleted:
+            every_tag.filter(pk__in=deleted).update(deleted_at=None)
+            for tag in tags.values():
+                tag.deleted_at = None
+
+        if missing:
+            slugs = allocate_slugs(every_tag.all(), [make_base_slug(name, self.model) for name in missing])
+            every_tag.bulk_create(
+                [self.model(name=name, slug=slug) for name, slug in zip(missing, slugs)],
+                ignore_conflicts=True,
+            )
+            tags.update(every_tag.in_bulk(missing, field_name='name'))
+
+            # Rows skipped on a concurrent slug conflict
+            for name in missing:
+                if name not in tags:
+                    tags[name], _ = every_tag.get_or_create(name=name)
+
+        return [tags[name] for name in names]
+
+class Tag(SlugAllocationMixin, AbstractBaseModel):
     """
     Tag model represents tags that associated  with post
     """
@@ -72,6 +103,13 @@ class Tag(AbstractBaseModel):
 
     name = CharField(max_length=NAME_MAX_LEN, unique=True)
     slug = SlugField(unique=True, blank=True)
+    # Denormalized from live published posts, see apps.blog.counters
+    published_post_count = PositiveIntegerField(default=0)
+
+    objects = TagManager()
+
+    class Meta:
+        default_manager_name = 'objects'
 
     def __str__(self) -> str:
         """Returns the string representation of the Tag"""
@@ -81,23 +119,13 @@ class Tag(AbstractBaseModel):
         """Returns the official string representation of the object."""
         return f"Category(id={self.id}, name={self.name}, slug={self.slug})"
     
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.name)
-            slug = base_slug
-            counter = 1
-            while Tag.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
-    
-class Post(AbstractBaseModel):  
+class Post(SlugAllocationMixin, AbstractBaseModel):  
     """
     Post object that store the posts of authors
     """
 
     TITLE_MAX_LEN = 200
+    SLUG_SOURCE_FIELD = 'title'
     STATUS_DRAFT = "drft"
     STATUS_DRAFT_LABEL = "draft"
     STATUS_PUBLISHED = "pub"
@@ -106,6 +134,12 @@ class Post(AbstractBaseModel):
         STATUS_DRAFT: STATUS_DRAFT_LABEL,
         STATUS_PUBLISHED: STATUS_PUBLISHED_LABEL,
     }
+    # Counters are updated without touching updated_at, see
+    # apps.abstracts.conditional
+    LAST_MODIFIED_FIELDS = ('last_comment_at',)
+    CHECKSUM_FIELDS = ('comment_count',)
+    # Decide whether and where the post is counted, see apps.blog.signals
+    COUNTED_FIELDS = ('status', 'category_id', 'deleted_at')
 
     author = ForeignKey(to=CustomUser, on_delete=CASCADE)
     title = CharField(max_length=TITLE_MAX_LEN)
@@ -118,22 +152,64 @@ class Post(AbstractBaseModel):
     )
     tags = ManyToManyField(Tag, blank=True)
     status = CharField(choices=TEXT_CHOICES)
+    # Denormalized from live comments, see apps.blog.counters
+    comment_count = PositiveIntegerField(default=0)
+    last_comment_at = DateTimeField(null=True, blank=True)
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            while Post.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
+    class Meta:
+        indexes = [
+            # Serves the keyset pagination of the published posts feed
+            models.Index(
+                fields=['status', 'created_at', 'id'],
+                name='blog_post_alive_feed_idx',
+                condition=Q(deleted_at__isnull=True),
+            ),
+            # Serve the same feed filtered by author or by category
+            models.Index(
+                fields=['author', 'status', 'created_at', 'id'],
+                name='blog_post_author_feed_idx',
+                condition=Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=['category', 'status', 'created_at', 'id'],
+                name='blog_post_category_feed_idx',
+                condition=Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self) -> str:
         """Returns the string representation of the Tag"""
         return self.title
 
+    @classmethod
+    def from_db(cls, *args: tuple[Any, ...], **kwargs: dict[Any, Any]) -> 'Post':
+        post = super().from_db(*args, **kwargs)
+        post.remember_counted_fields()
+        return post
+
+    def refresh_from_db(
+        self,
+        using: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        **kwargs: dict[Any, Any],
+    ) -> None:
+        super().refresh_from_db(using, fields, **kwargs)
+        self.remember_counted_fields(fields)
+
+    def remember_counted_fields(self, fields: Optional[Iterable[str]] = None) -> None:
+        """
+        Keeps the stored values of COUNTED_FIELDS, so saves can tell what
+        changed without reading the row again. Deferred ones are left out.
+        """
+
+        names = self.COUNTED_FIELDS
+        if fields is not None:
+            fields = set(fields)
+            names = [name for name in names if name in fields or name.removesuffix('_id') in fields]
+
+        stored = self.__dict__.setdefault('_stored_counted_fields', {})
+        stored.update({name: self.__dict__[name] for name in names if name in self.__dict__})
+
 
 
 class Comment(AbstractBaseModel):
@@ -141,3 +217,37 @@ class Comment(AbstractBaseModel):
     author = ForeignKey(to=CustomUser, on_delete=CASCADE, related_name='author')
     body = TextField()     
 
+    class Meta:
+        indexes = [
+            # Serves the keyset pagination of the comments of a post
+            models.Index(
+                fields=['post', 'created_at', 'id'],
+                name='blog_comment_alive_post_idx',
+                condition=Q(deleted_at__isnull=True),
+            ),
+        ]
+
+    def save(self, *args: tuple[Any, ...], **kwargs: dict[Any, Any]) -> None:
+        """Saves the comment, counting a new one on its post"""
+
+        from apps.blog.counters import comment_added
+
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            comment_added(self.post, self.created_at)
+
+    def delete(self, *args: tuple[Any, ...], **kwargs: dict[Any, Any]) -> None:
+        """Soft deletes the comment and uncounts it on its post"""
+
+        from apps.blog.counters import comment_removed
+
+        if self.deleted_at is not None:
+            return
+
+        with transaction.atomic():
+            super().delete(*args, **kwargs)
+            comment_removed(self.post)
+
@@ -0,0 +1,181 @@
+# Python modules
+import re
+
+# Django modules
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.models import Q, QuerySet
+
+# Project modules
+from apps.users.models import CustomUser
+
+# PostgreSQL text search configuration per user language. There is no
+# Kazakh stemmer, so Kazakh goes through `simple`.
+SEARCH_CONFIGS = {
+    CustomUser.EN: 'english',
+    CustomUser.RU: 'russian',
+    CustomUser.KZ: 'simple',
+}
+DEFAULT_SEARCH_CONFIG = 'simple'
+
+POST_TABLE = 'blog_post'
+FTS_TABLE = 'blog_post_fts'
+# bm25 weights of the title and body columns
+FTS_WEIGHTS = (10.0, 1.0)
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# External content FTS5 index of live posts. unicode61 folds case of
+# Cyrillic as well as Latin, porter stems English words only.
+SQLITE_FTS_TABLE = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title,
+        body,
+        content='{POST_TABLE}',
+        content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+"""
+SQLITE_FTS_POPULATE = f"""
+    INSERT INTO {FTS_TABLE}(rowid, title, body)
+    SELECT id, title, body FROM {POST_TABLE} WHERE deleted_at IS NULL
+"""
+# Soft deleted posts leave the index, restored ones come back
+SQLITE_FTS_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {POST_TABLE}
+    WHEN new.deleted_at IS NULL BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {POST_TABLE}
+    WHEN old.deleted_at IS NULL BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, body, deleted_at ON {POST_TABLE}
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body)
+        SELECT 'delete', old.id, old.title, old.body WHERE old.deleted_at IS NULL;
+        INSERT INTO {FTS_TABLE}(rowid, title, body)
+        SELECT new.id, new.title, new.body WHERE new.deleted_at IS NULL;
+    END
+    """,
+)
+
+
+def get_postgres_search_indexes() -> list:
+    """Returns GIN indexes matching the vectors search_posts builds"""
+
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    return [
+        GinIndex(
+            SearchVector('title', 'body', config=config),
+            name=f'blog_post_search_{config}_idx',
+        )
+        for config in sorted(set(SEARCH_CONFIGS.values()))
+    ]
+
+
+def install_search_index(schema_editor: BaseDatabaseSchemaEditor, post_model: type) -> None:
+    """Creates the search index of the database backend, if it has one"""
+
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'sqlite':
+        schema_editor.execute(SQLITE_FTS_TABLE)
+        schema_editor.execute(SQLITE_FTS_POPULATE)
+        for trigger in SQLITE_FTS_TRIGGERS:
+            schema_editor.execute(trigger)
+    elif vendor == 'postgresql':
+        for index in get_postgres_search_indexes():
+            schema_editor.add_index(post_model, index)
+
+
+def uninstall_search_index(schema_editor: BaseDatabaseSchemaEditor, post_model: type) -> None:
+    """Drops whatever install_search_index created"""
+
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'sqlite':
+        for suffix in ('ai', 'ad', 'au'):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+    elif vendor == 'postgresql':
+        for index in get_postgres_search_indexes():
+            schema_editor.remove_index(post_model, index)
+
+
+def ensure_sqlite_triggers(connection: BaseDatabaseWrapper) -> None:
+    """
+    Recreates FTS triggers dropped by SQLite table rebuilds, which happen
+    whenever a migration alters the post table.
+    """
+
+    if connection.vendor != 'sqlite':
+        return
+
+    with connection.cursor() as cursor:
+        if FTS_TABLE not in connection.introspection.table_names(cursor):
+            return
+        for trigger in SQLITE_FTS_TRIGGERS:
+            cursor.execute(trigger)
+
+
+def search_posts(queryset: QuerySet, query: str, language: str) -> QuerySet:
+    """Returns posts matching the query, most relevant first"""
+
+    vendor = connections[queryset.db].vendor
+
+    if vendor == 'sqlite':
+        return search_posts_sqlite(queryset, query)
+    if vendor == 'postgresql':
+        return search_posts_postgres(queryset, query, language)
+
+    return queryset.filter(
+        Q(title__icontains=query) | Q(body__icontains=query)
+    ).order_by('-created_at', '-pk')
+
+
+def search_posts_sqlite(queryset: QuerySet, query: str) -> QuerySet:
+    # Every word is quoted, so user input can't use FTS5 query syntax,
+    # and matched as a prefix to catch inflected Russian and Kazakh forms.
+    tokens = TOKEN_PATTERN.findall(query)
+    if not tokens:
+        return queryset.none()
+
+    match = ' '.join(f'"{token}"*' for token in tokens)
+    weights = ', '.join(str(weight) for weight in FTS_WEIGHTS)
+
+    # The index is joined rather than queried per row, so the match runs
+    # once and bm25 is read off the same scan. The unary plus hides the
+    # rowid from the index, or the planner may scan posts and run the
+    # match again for every one of them. The ORM has no join to a virtual
+    # table, hence extra().
+    return queryset.extra(
+        tables=[FTS_TABLE],
+        where=[f'"{POST_TABLE}"."id" = +"{FTS_TABLE}".rowid', f'"{FTS_TABLE}" MATCH %s'],
+        params=[match],
+        select={'rank': f'bm25("{FTS_TABLE}", {weights})'},
+    ).order_by('rank', '-created_at', '-pk')
+
+
+def search_posts_postgres(queryset: QuerySet, query: str, language: str) -> QuerySet:
+    from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+    config = SEARCH_CONFIGS.get(language, DEFAULT_SEARCH_CONFIG)
+    # Same expression as the GIN index of the config, so the index is used
+    vector = SearchVector('title', 'body', config=config)
+    search_query = SearchQuery(query, config=config, search_type='websearch')
+
+    return queryset.annotate(
+        search=vector,
+        rank=SearchRank(vector, search_query),
+    ).filter(
+        search=search_query,
+    ).order_by('-rank', '-created_at', '-pk')
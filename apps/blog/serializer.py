@@ -1,9 +1,7 @@
-from typing import Any, Optional
+from typing import Any
 from datetime import datetime
-from zoneinfo import ZoneInfo
 
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer, BaseChannelLayer
+from django.db import transaction
 from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 from rest_framework.serializers import (
@@ -13,20 +11,22 @@ from rest_framework.serializers import (
     StringRelatedField,
     ValidationError,
     CharField,
+    EmailField,
+    IntegerField,
     ListField,
     ChoiceField
 )
-from rest_framework.request import Request as DRFRequest
-from babel.dates import format_datetime
 
 from apps.blog.models import (
     Post,
     Category, 
     Tag, 
     Comment,
-    CategoryTranslations
 )
+from apps.blog.caches import category_names
 from apps.abstracts.serializers import CustomUserForeignSerializer
+from apps.abstracts.formatters import LocalDateTimeFormatter
+from apps.notifications.dispatcher import comment_broadcasts
 
 class PostBaseSerializer(ModelSerializer):
     """
@@ -45,13 +45,23 @@ class CategorySerializer(Serializer):
     slug = CharField()
     
     def get_name(self,obj: Category) -> str:
-        language = get_language()
-        translation = obj.translations.filter(language=language).first()
-        
-        if translation:
-            return translation.name
-        
-        return obj.name
+        names = self.context.get('category_names')
+        if names is None:
+            names = category_names.get_names()
+
+        return names.get((obj.pk, get_language()), obj.name)
+
+class CategoryListSerializer(CategorySerializer):
+    published_post_count = IntegerField()
+
+class TagListSerializer(ModelSerializer):
+    class Meta:
+        model = Tag
+        fields = [
+            'name',
+            'slug',
+            'published_post_count',
+        ]
 
 class PostListSerializer(PostBaseSerializer):
 
@@ -61,6 +71,7 @@ class PostListSerializer(PostBaseSerializer):
     category = CategorySerializer()
     created_at = SerializerMethodField()
     updated_at = SerializerMethodField()
+    last_comment_at = SerializerMethodField()
     
     class Meta:
         model = Post
@@ -75,31 +86,37 @@ class PostListSerializer(PostBaseSerializer):
             'status',
             'author',
             'created_at',
-            'updated_at'
+            'updated_at',
+            'comment_count',
+            'last_comment_at',
         ]
 
     def get_status(self, obj) -> str:
         return obj.get_status_display()
     
-    def format_local_datetime(self, dt:datetime, request:Optional[DRFRequest] = None):
-        lang = get_language() 
-        if request and hasattr(request, 'user') and request.user.is_authenticated:
-            tz_str = request.user.timezone 
-        else:
-            tz_str = 'UTC'
-        
-        tz = ZoneInfo(tz_str)
-        localized = dt.astimezone(tz)
-        
-        return format_datetime(localized, format='long', locale=lang)
+    @property
+    def datetime_formatter(self) -> LocalDateTimeFormatter:
+        """Formatter shared by every row of the response"""
+
+        formatter = self.context.get('datetime_formatter')
+        if formatter is None:
+            formatter = LocalDateTimeFormatter.for_request(self.context.get('request'))
+            self.context['datetime_formatter'] = formatter
+        return formatter
+
+    def format_local_datetime(self, dt:datetime) -> str:
+        return self.datetime_formatter.format(dt)
 
     def get_created_at(self, obj):
-        request = self.context.get('request')
-        return self.format_local_datetime(obj.created_at, request)
+        return self.format_local_datetime(obj.created_at)
     
     def get_updated_at(self, obj):
-        request = self.context.get('request')
-        return self.format_local_datetime(obj.updated_at, request)
+        return self.format_local_datetime(obj.updated_at)
+
+    def get_last_comment_at(self, obj) -> str|None:
+        if obj.last_comment_at is None:
+            return None
+        return self.format_local_datetime(obj.last_comment_at)
 
 
 class PostCreateSerializer(PostBaseSerializer):
@@ -141,12 +158,8 @@ class PostCreateSerializer(PostBaseSerializer):
     def validate_tags(self, value: list[str]) -> list[Tag]:
         if not value:
             return []
-        tags = []
-        for tag_name in value:
-            tag, _ = Tag.objects.get_or_create(name=tag_name)
-            tags.append(tag)
 
-        return tags
+        return Tag.objects.resolve(value)
     
     def create(self, validated_data: dict[Any, Any]) -> Post:
         tags = validated_data.pop('tags', [])
@@ -164,6 +177,33 @@ class PostCreateSerializer(PostBaseSerializer):
                 return code
         raise ValidationError(f"Invalid status '{value}'.")
     
+class PostImportRowSerializer(Serializer):
+    """
+    Validates one row of a bulk import. Authors, categories and tags are
+    kept as given, the importer resolves them for the whole chunk.
+    """
+    title = CharField(max_length=Post.TITLE_MAX_LEN)
+    body = CharField()
+    author = EmailField(required=False)
+    category = CharField(required=False, allow_null=True, allow_blank=True)
+    tags = ListField(
+        child=CharField(max_length=Tag.NAME_MAX_LEN),
+        required=False,
+        default=list
+    )
+    status = ChoiceField(
+    choices=[(label, label) for label in Post.TEXT_CHOICES.values()],
+    default=Post.STATUS_DRAFT_LABEL,
+    required=False,
+    )
+
+    def validate_status(self, value: str) -> str:
+        for code, label in Post.TEXT_CHOICES.items():
+            if label == value:
+                return code
+        raise ValidationError(f"Invalid status '{value}'.")
+
+
 class PostUpdateSerializer(PostBaseSerializer):
     category = CharField(required=False, allow_null=True, allow_blank=True)
     tags = ListField(
@@ -202,13 +242,7 @@ class PostUpdateSerializer(PostBaseSerializer):
         if value is None:
             return None
 
-        tags = []
-
-        for tag_name in value:
-            tag, _ = Tag.objects.get_or_create(name=tag_name)
-            tags.append(tag)
-
-        return tags
+        return Tag.objects.resolve(value)
     
     def validate_status(self, value: list[str]) -> list[Tag]:
         for code, label in Post.TEXT_CHOICES.items():
@@ -265,20 +299,22 @@ class CommentCreateSerializer(CommentBaseSerializer):
     def create(self, validated_data: dict[Any, Any]) -> Comment:
         
         comment = Comment.objects.create(**validated_data)
-        post = comment.post
-
-        channel_layer:BaseChannelLayer|None = get_channel_layer()
-        async_to_sync(channel_layer.group_send)(
-            f"post_{comment.post.slug}", {
-                "type": "post.comment",
-                "message": {
-                    "comment_id": comment.id,
-                    "author": comment.author.respresent_with_email(),
-                    "post": str(comment.body),
-                    "created_at": str(comment.created_at)
-                }
+        post: Post = validated_data['post']
+        author = validated_data['author']
+
+        group = f"post_{post.slug}"
+        event = {
+            "type": "post.comment",
+            "message": {
+                "comment_id": comment.id,
+                "author": author.respresent_with_email(),
+                "post": str(comment.body),
+                "created_at": str(comment.created_at)
             }
-        )
+        }
+        # Listeners only hear about committed comments, and the write
+        # doesn't wait for the channel layer.
+        transaction.on_commit(lambda: comment_broadcasts.enqueue(group, event))
        
         return comment
 
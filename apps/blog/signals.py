@@ -0,0 +1,301 @@
+# Python modules
+from datetime import datetime
+from typing import Any, Optional
+
+# Django modules
+from django.apps import AppConfig
+from django.db import connections
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+# Project modules
+from apps.blog.models import Category, CategoryTranslations, Comment, Post, Tag
+from apps.blog.caches import category_names, forget_posts_live_on_commit, post_responses
+from apps.blog.search import ensure_sqlite_triggers
+from apps.blog.counters import (
+    recount_category_posts,
+    recount_comments,
+    recount_post_taxonomy,
+    recount_tag_posts,
+)
+from apps.users.models import CustomUser
+from apps.abstracts.signals import soft_delete_changed
+
+
+def invalidate_related_posts(**filters: Any) -> None:
+    """Drops cached responses of posts matching the filters, if any"""
+
+    slugs = list(Post._base_manager.filter(**filters).values_list('slug', flat=True))
+    if slugs:
+        post_responses.invalidate_on_commit(slugs)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(soft_delete_changed, sender=Category)
+@receiver(post_save, sender=CategoryTranslations)
+@receiver(post_delete, sender=CategoryTranslations)
+@receiver(soft_delete_changed, sender=CategoryTranslations)
+def invalidate_category_names(sender: type, **kwargs: dict[str, Any]) -> None:
+    """Drops cached category names when categories or translations change"""
+
+    category_names.invalidate_on_commit()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_responses(sender: type, instance: Post, **kwargs: dict[str, Any]) -> None:
+    """Drops cached responses and liveness of the saved or deleted post"""
+
+    post_responses.invalidate_on_commit([instance.slug])
+    forget_posts_live_on_commit([instance.slug])
+
+
+@receiver(soft_delete_changed, sender=Post)
+def invalidate_bulk_deleted_posts(sender: type, pks: list[int], **kwargs: dict[str, Any]) -> None:
+    """Drops cached responses and liveness of posts deleted or restored in bulk"""
+
+    slugs = list(Post._base_manager.filter(pk__in=pks).values_list('slug', flat=True))
+    post_responses.invalidate_on_commit(slugs)
+    forget_posts_live_on_commit(slugs)
+
+
+@receiver(soft_delete_changed, sender=Post)
+def recount_bulk_deleted_post_taxonomy(sender: type, pks: list[int], **kwargs: dict[str, Any]) -> None:
+    """Recounts tags and categories of posts deleted or restored in bulk"""
+
+    recount_post_taxonomy(pks)
+
+
+def is_counted(status: Optional[str], deleted_at: Optional[datetime]) -> bool:
+    """Tells whether a post with these values counts towards its tags and category"""
+
+    return status == Post.STATUS_PUBLISHED and deleted_at is None
+
+
+@receiver(pre_save, sender=Post)
+def remember_former_counted_fields(
+    sender: type,
+    instance: Post,
+    update_fields: Optional[frozenset[str]],
+    **kwargs: dict[str, Any],
+) -> None:
+    """Keeps what the post was counted as before the save, if the save may change it"""
+
+    instance._former_counted_fields = None
+    if update_fields is not None and not any(
+        name in update_fields or name.removesuffix('_id') in update_fields for name in Post.COUNTED_FIELDS
+    ):
+        return
+
+    if instance._state.adding:
+        instance._former_counted_fields = {}
+        return
+
+    stored = instance.__dict__.setdefault('_stored_counted_fields', {})
+    missing = [name for name in Post.COUNTED_FIELDS if name not in stored]
+    if missing:
+        # Built by hand or loaded with the fields deferred
+        stored.update(Post._base_manager.filter(pk=instance.pk).values(*missing).first() or {})
+    instance._former_counted_fields = dict(stored)
+
+
+@receiver(post_save, sender=Post)
+def recount_saved_post_taxonomy(
+    sender: type,
+    instance: Post,
+    created: bool,
+    update_fields: Optional[frozenset[str]],
+    **kwargs: dict[str, Any],
+) -> None:
+    """Recounts tags and categories the saved post joined or left"""
+
+    former = getattr(instance, '_former_counted_fields', None)
+    if former is None:
+        return
+
+    instance.remember_counted_fields(update_fields)
+    saved = instance._stored_counted_fields
+    was_counted = is_counted(former.get('status'), former.get('deleted_at'))
+    now_counted = is_counted(saved['status'], saved['deleted_at'])
+    moved = former.get('category_id') != saved['category_id']
+    if was_counted == now_counted and not (now_counted and moved):
+        return
+
+    if was_counted != now_counted and not created:
+        recount_tag_posts(
+            Post.tags.through.objects.filter(post_id=instance.pk).values_list('tag_id', flat=True)
+        )
+    category_ids = {former.get('category_id'), saved['category_id']} - {None}
+    if category_ids:
+        recount_category_posts(category_ids)
+
+
+@receiver(pre_delete, sender=Post)
+def remember_deleted_post_tags(sender: type, instance: Post, **kwargs: dict[str, Any]) -> None:
+    """Keeps the tags of a counted post deleted for good, its tag links go first"""
+
+    if is_counted(instance.status, instance.deleted_at):
+        instance._deleted_tag_ids = list(
+            Post.tags.through.objects.filter(post_id=instance.pk).values_list('tag_id', flat=True)
+        )
+
+
+@receiver(post_delete, sender=Post)
+def recount_hard_deleted_post_taxonomy(sender: type, instance: Post, **kwargs: dict[str, Any]) -> None:
+    """Uncounts a live published post deleted for good, like one purged with its author"""
+
+    if not is_counted(instance.status, instance.deleted_at):
+        return
+
+    tag_ids = getattr(instance, '_deleted_tag_ids', ())
+    if tag_ids:
+        recount_tag_posts(tag_ids)
+    if instance.category_id is not None:
+        recount_category_posts([instance.category_id])
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def recount_changed_tags(
+    sender: type,
+    instance: Post | Tag,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[set[int]],
+    **kwargs: dict[str, Any],
+) -> None:
+    """Recounts tags added to or removed from posts"""
+
+    if reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            recount_tag_posts([instance.pk])
+        return
+
+    if instance.status != Post.STATUS_PUBLISHED or instance.deleted_at is not None:
+        return
+
+    if action == 'pre_clear':
+        instance._cleared_tag_ids = list(instance.tags.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        recount_tag_posts(getattr(instance, '_cleared_tag_ids', ()))
+    elif action in ('post_add', 'post_remove') and pk_set:
+        recount_tag_posts(pk_set)
+
+
+@receiver(soft_delete_changed, sender=Comment)
+def recount_bulk_deleted_comments(sender: type, pks: list[int], **kwargs: dict[str, Any]) -> None:
+    """Recounts comments of posts whose comments were deleted or restored in bulk"""
+
+    post_ids = set(Comment.all_objects.filter(pk__in=pks).values_list('post_id', flat=True))
+    recount_comments(post_ids)
+    invalidate_related_posts(pk__in=post_ids)
+
+
+@receiver(post_delete, sender=Comment)
+def recount_hard_deleted_comment(sender: type, instance: Comment, **kwargs: dict[str, Any]) -> None:
+    """Uncounts a live comment deleted for good, like one purged with its author"""
+
+    if instance.deleted_at is not None:
+        return
+
+    recount_comments([instance.post_id])
+    invalidate_related_posts(pk=instance.post_id)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def invalidate_post_tags_responses(
+    sender: type,
+    instance: Post | Tag,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[set[int]],
+    **kwargs: dict[str, Any],
+) -> None:
+    """Drops cached responses of posts whose tags were changed"""
+
+    if action not in ('post_add', 'post_remove', 'post_clear', 'pre_clear'):
+        return
+
+    if not reverse:
+        if action != 'pre_clear':
+            post_responses.invalidate_on_commit([instance.slug])
+    elif action == 'pre_clear':
+        invalidate_related_posts(tags=instance)
+    elif action != 'post_clear':
+        invalidate_related_posts(pk__in=pk_set)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(pre_delete, sender=Tag)
+def invalidate_tag_responses(sender: type, instance: Tag, **kwargs: dict[str, Any]) -> None:
+    """Drops cached responses of posts with the tag"""
+
+    invalidate_related_posts(tags=instance)
+
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def invalidate_category_responses(sender: type, instance: Category, **kwargs: dict[str, Any]) -> None:
+    """Drops cached responses of posts in the category"""
+
+    invalidate_related_posts(category=instance)
+
+
+@receiver(soft_delete_changed, sender=Tag)
+def invalidate_bulk_deleted_tag_responses(sender: type, pks: list[int], **kwargs: dict[str, Any]) -> None:
+    """Drops cached responses of posts with tags deleted or restored in bulk"""
+
+    invalidate_related_posts(tags__in=pks)
+
+
+@receiver(soft_delete_changed, sender=Category)
+def invalidate_bulk_deleted_category_responses(sender: type, pks: list[int], **kwargs: dict[str, Any]) -> None:
+    """Drops cached responses of posts in categories deleted or restored in bulk"""
+
+    invalidate_related_posts(category_id__in=pks)
+
+
+@receiver(post_save, sender=CategoryTranslations)
+@receiver(post_delete, sender=CategoryTranslations)
+def invalidate_translation_responses(
+    sender: type,
+    instance: CategoryTranslations,
+    **kwargs: dict[str, Any],
+) -> None:
+    """Drops cached responses of posts in the translated category"""
+
+    invalidate_related_posts(category_id=instance.orig_category_id)
+
+
+@receiver(soft_delete_changed, sender=CategoryTranslations)
+def invalidate_bulk_deleted_translation_responses(
+    sender: type,
+    pks: list[int],
+    **kwargs: dict[str, Any],
+) -> None:
+    """Drops cached responses of posts in categories whose translations were deleted or restored in bulk"""
+
+    category_ids = CategoryTranslations.all_objects.filter(pk__in=pks).values('orig_category_id')
+    invalidate_related_posts(category_id__in=category_ids)
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_author_responses(sender: type, instance: CustomUser, **kwargs: dict[str, Any]) -> None:
+    """Drops cached responses of posts rendering the saved author"""
+
+    invalidate_related_posts(author=instance)
+
+
+@receiver(post_migrate)
+def restore_search_triggers(sender: AppConfig, using: str, **kwargs: dict[str, Any]) -> None:
+    """Puts back search triggers lost when a migration rebuilt the post table"""
+
+    if sender.name == 'apps.blog':
+        ensure_sqlite_triggers(connections[using])
@@ -1,3 +1,583 @@
+# Python modules
+from datetime import timedelta
+from io import StringIO
+from typing import Any, Optional
+from unittest import skipUnless
+from unittest.mock import patch
+
+# Django modules
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import QuerySet
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.request import Request as DRFRequest
+from rest_framework.test import APIClient, APIRequestFactory
+
+# Project modules
+from apps.abstracts.slugs import allocate_slugs
+from apps.blog.caches import LIVE_POST_KEY, category_names, get_version, post_responses
+from apps.blog.filters import PostFilterBackend
+from apps.blog.imports import PostImporter
+from apps.blog.models import Category, CategoryTranslations, Comment, Post, Tag
+from apps.blog.search import search_posts
+from apps.blog.views import PostViewSet
+from apps.users.models import CustomUser
+
+
+PASSWORD = 'pass12345xx'
+
+
+def create_user(name: str = 'Author') -> CustomUser:
+    """Creates a user called `name`, with the `<name>@example.com` email"""
+
+    return CustomUser.objects.create_user(
+        email=f'{name.lower()}@example.com',
+        first_name=name,
+        last_name='Example',
+        password=PASSWORD,
+    )
+
+
+def create_post(author: CustomUser, title: str = 'Hello', **fields: Any) -> Post:
+    """Creates a post of the author, published unless `fields` say otherwise"""
+
+    fields = {'body': 'Body', 'status': Post.STATUS_PUBLISHED, **fields}
+    return Post.objects.create(author=author, title=title, **fields)
+
+
+class SlugAllocationTests(TestCase):
+    """Slugs allocated on save and in bulk"""
+
+    def test_suffix_past_nine_digits(self) -> None:
+        for slug in ('weekly', 'weekly-999999999', 'weekly-1000000000'):
+            Tag.objects.create(name=slug, slug=slug)
+
+        tag = Tag.objects.create(name='Weekly')
+
+        self.assertEqual(tag.slug, 'weekly-1000000001')
+
+    def test_number_in_title_is_not_a_suffix(self) -> None:
+        Tag.objects.create(name='Weekly update')
+
+        slugs = allocate_slugs(Tag.objects.all(), ['weekly-update-2024', 'weekly-update'])
+
+        self.assertEqual(slugs, ['weekly-update-2024', 'weekly-update-1'])
+
+    def test_suffix_taken_within_batch(self) -> None:
+        Tag.objects.create(name='Weekly')
+
+        slugs = allocate_slugs(Tag.objects.all(), ['weekly-1', 'weekly'])
+
+        self.assertEqual(slugs, ['weekly-1', 'weekly-2'])
+
+    def test_clashing_slug_falls_back_to_random_suffix(self) -> None:
+        Tag.objects.create(name='Weekly')
+
+        with patch('apps.abstracts.models.next_available_slug', return_value='weekly'):
+            tag = Tag.objects.create(name='Weekly!')
+
+        self.assertRegex(tag.slug, r'^weekly-[0-9a-f]{8}$')
+
+    def test_title_without_slug_characters(self) -> None:
+        author = create_user()
+        create_post(author, 'Новости')
+        PostImporter(default_author=author).run(['{"title": "Жаңалықтар", "body": "Body"}'])
+
+        self.assertEqual(sorted(Post.objects.values_list('slug', flat=True)), ['post', 'post-1'])
+        self.assertEqual(Category.objects.create(name='!!!').slug, 'category')
+
+
+class ResponseCacheInvalidationTests(TestCase):
+    """Cached responses dropped by writes"""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.author = create_user()
+
+    def test_list_is_invalidated_on_commit(self) -> None:
+        version = get_version(post_responses.LIST_VERSION_KEY)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            create_post(self.author)
+            self.assertEqual(get_version(post_responses.LIST_VERSION_KEY), version)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_version(post_responses.LIST_VERSION_KEY), version)
+
+    def test_bulk_deleted_taxonomy_invalidates_posts(self) -> None:
+        category = Category.objects.create(name='Tech')
+        translation = CategoryTranslations.objects.create(orig_category=category, language='ru', name='Техно')
+        post = create_post(self.author, category=category)
+        post.tags.set(Tag.objects.resolve(['python']))
+        key = post_responses.POST_VERSION_KEY.format(slug=post.slug)
+
+        for instance in (post.tags.get(), category, translation):
+            model = type(instance)
+            for operation in ('soft_delete', 'restore'):
+                with self.subTest(model=model.__name__, operation=operation):
+                    version = get_version(key)
+                    names_version = get_version(category_names.VERSION_KEY)
+
+                    with self.captureOnCommitCallbacks(execute=True):
+                        getattr(model.all_objects.filter(pk=instance.pk), operation)()
+
+                    self.assertNotEqual(get_version(key), version)
+                    if model is not Tag:
+                        self.assertNotEqual(get_version(category_names.VERSION_KEY), names_version)
+
+
+class ConditionalRequestTests(TestCase):
+    """ETag and Last-Modified of post responses"""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.author = create_user()
+        self.post = create_post(self.author)
+        # Keeps the new comment in a later second than the post
+        Post.objects.filter(pk=self.post.pk).update(updated_at=timezone.now() - timedelta(hours=1))
+
+    def test_new_comment_changes_validators(self) -> None:
+        url = f'/api/posts/{self.post.slug}/'
+        response = self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.create(post=self.post, author=self.author, body='First')
+
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_MODIFIED_SINCE=response.headers['Last-Modified']).status_code,
+            200,
+        )
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response.headers['ETag']).status_code, 200)
+
+    def test_removed_comment_changes_etag(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            comment = Comment.objects.create(post=self.post, author=self.author, body='First')
+        url = f'/api/posts/{self.post.slug}/'
+        etag = self.client.get(url).headers['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            comment.delete()
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class CommentCounterTests(TestCase):
+    """Comment count and last comment time kept on posts"""
+
+    def setUp(self) -> None:
+        self.author = create_user()
+        self.post = create_post(self.author)
+
+    def comment(self, body: str) -> Comment:
+        return Comment.objects.create(post=self.post, author=self.author, body=body)
+
+    def assertCounters(self, count: int, last_comment: Comment | None) -> None:
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, count)
+        self.assertEqual(self.post.last_comment_at, last_comment.created_at if last_comment else None)
+
+    def test_create(self) -> None:
+        self.comment('First')
+        second = self.comment('Second')
+
+        self.assertCounters(2, second)
+
+    def test_soft_delete(self) -> None:
+        first = self.comment('First')
+        second = self.comment('Second')
+
+        second.delete()
+        second.delete()
+
+        self.assertCounters(1, first)
+
+    def test_bulk_soft_delete_and_restore(self) -> None:
+        self.comment('First')
+        second = self.comment('Second')
+
+        Comment.objects.filter(post=self.post).soft_delete()
+        self.assertCounters(0, None)
+
+        Comment.all_objects.filter(post=self.post).restore()
+        self.assertCounters(2, second)
+
+    def test_reconcile_counters(self) -> None:
+        comment = self.comment('First')
+        Post.objects.filter(pk=self.post.pk).update(comment_count=5, last_comment_at=None)
+        output = StringIO()
+
+        call_command('reconcilecounters', stdout=output)
+
+        self.assertCounters(1, comment)
+        self.assertIn("Posts with repaired comment counters: 1", output.getvalue())
+
+
+class PostTaxonomyCounterTests(TestCase):
+    """Published post counts kept on tags and categories"""
+
+    def setUp(self) -> None:
+        self.author = create_user()
+        self.category = Category.objects.create(name='News')
+        self.tag = Tag.objects.create(name='django')
+        post = create_post(self.author, category=self.category)
+        post.tags.add(self.tag)
+        self.post = Post.objects.get(pk=post.pk)
+
+    def assertCounts(self, category_count: int, tag_count: int) -> None:
+        self.category.refresh_from_db()
+        self.tag.refresh_from_db()
+        self.assertEqual((self.category.published_post_count, self.tag.published_post_count), (category_count, tag_count))
+
+    def test_edit_leaves_counters_alone(self) -> None:
+        self.post.title = 'Hello again'
+
+        # The UPDATE of the post only
+        with self.assertNumQueries(1):
+            self.post.save()
+
+        self.assertCounts(1, 1)
+
+    def test_unpublish_and_soft_delete(self) -> None:
+        self.post.status = Post.STATUS_DRAFT
+        self.post.save()
+        self.assertCounts(0, 0)
+
+        self.post.status = Post.STATUS_PUBLISHED
+        self.post.save(update_fields=['status'])
+        self.assertCounts(1, 1)
+
+        self.post.delete()
+        self.assertCounts(0, 0)
+
+    def test_move_to_another_category(self) -> None:
+        other = Category.objects.create(name='Releases')
+
+        self.post.category = other
+        self.post.save()
+
+        other.refresh_from_db()
+        self.assertEqual(other.published_post_count, 1)
+        self.assertCounts(0, 1)
+
+    def test_deferred_fields_are_read_before_save(self) -> None:
+        post = Post.objects.only('title', 'slug').get(pk=self.post.pk)
+        post.status = Post.STATUS_DRAFT
+
+        post.save(update_fields=['status'])
+
+        self.assertCounts(0, 0)
+
+    def test_hard_delete(self) -> None:
+        Post.objects.filter(pk=self.post.pk).delete()
+
+        self.assertCounts(0, 0)
+
+
+class PostImportTests(TestCase):
+    """Bulk import of NDJSON posts"""
+
+    def setUp(self) -> None:
+        self.author = create_user()
+        self.other = create_user('Other')
+        self.category = Category.objects.create(name='News')
+        self.client = APIClient()
+
+    def import_lines(self, email: str, *lines: str) -> dict[str, Any]:
+        access = self.client.post('/api/auth/token', {'email': email, 'password': PASSWORD}).data['access']
+        response = self.client.post(
+            '/api/posts/import/',
+            '\n'.join(lines),
+            content_type='application/x-ndjson',
+            HTTP_AUTHORIZATION=f'Bearer {access}',
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_author_can_only_import_own_posts(self) -> None:
+        report = self.import_lines(
+            'author@example.com',
+            '{"title": "Mine", "body": "Body"}',
+            '{"title": "Theirs", "body": "Body", "author": "other@example.com"}',
+        )
+
+        self.assertEqual((report['imported'], report['failed']), (1, 1))
+        self.assertEqual(report['errors'], [{'line': 2, 'errors': {'author': ["You can only import your own posts."]}}])
+        self.assertEqual(Post.objects.get().author, self.author)
+
+    def test_staff_can_import_for_other_authors(self) -> None:
+        CustomUser.objects.filter(pk=self.author.pk).update(is_staff=True)
+
+        report = self.import_lines(
+            'author@example.com',
+            '{"title": "Theirs", "body": "Body", "author": "other@example.com"}',
+        )
+
+        self.assertEqual(report['imported'], 1)
+        self.assertEqual(Post.objects.get().author, self.other)
+
+    def test_rejected_lines_are_reported(self) -> None:
+        report = self.import_lines(
+            'author@example.com',
+            '{"title": "First", "body": "Body"}',
+            '',
+            'not json',
+            '["title"]',
+            '{"body": "Body"}',
+            '{"title": "Lost", "body": "Body", "category": "Missing"}',
+            '{"title": "Last", "body": "Body", "status": "published"}',
+        )
+
+        self.assertEqual((report['imported'], report['failed']), (2, 4))
+        self.assertEqual([error['line'] for error in report['errors']], [3, 4, 5, 6])
+        self.assertEqual(report['errors'][2]['errors'], {'title': ["This field is required."]})
+        self.assertEqual(report['errors'][3]['errors'], {'category': ["Category 'Missing' does not exist"]})
+        self.assertEqual(sorted(Post.objects.values_list('title', flat=True)), ['First', 'Last'])
+
+    def test_slugs_taken_meanwhile_are_allocated_again(self) -> None:
+        create_post(self.author, status=Post.STATUS_DRAFT)
+        calls = []
+
+        def allocate_stale_slugs(queryset: QuerySet, base_slugs: list[str]) -> list[str]:
+            # The first allocation misses the post above, like one
+            # inserted by a concurrent writer
+            calls.append(base_slugs)
+            return base_slugs if len(calls) == 1 else allocate_slugs(queryset, base_slugs)
+
+        with patch('apps.blog.imports.allocate_slugs', side_effect=allocate_stale_slugs):
+            report = PostImporter(default_author=self.author).run(['{"title": "Hello", "body": "Body"}'])
+
+        self.assertEqual((report.imported, len(calls)), (1, 2))
+        self.assertEqual(sorted(Post.objects.values_list('slug', flat=True)), ['hello', 'hello-1'])
+
+    def test_counters_are_refreshed(self) -> None:
+        lines = [
+            '{"title": "One", "body": "Body", "status": "published", "category": "News", "tags": ["django"]}',
+            '{"title": "Two", "body": "Body", "status": "published", "category": "News", "tags": ["django", "rust"]}',
+            '{"title": "Draft", "body": "Body", "category": "News", "tags": ["rust"]}',
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PostImporter(default_author=self.author, chunk_size=2).run(lines)
+
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.published_post_count, 2)
+        self.assertEqual(dict(Tag.objects.values_list('name', 'published_post_count')), {'django': 2, 'rust': 1})
+
+
+class PostAsyncReadViewTests(TestCase):
+    """Post list and detail served on the event loop"""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.author = create_user()
+        self.post = create_post(self.author)
+
+    async def get(self, url: str, params: Optional[dict[str, str]] = None, **headers: str):
+        """Requests the url, failing if PostViewSet had to answer it"""
+
+        with patch.object(PostViewSet, 'list') as drf_list, patch.object(PostViewSet, 'retrieve') as drf_retrieve:
+            response = await self.async_client.get(url, params, headers=headers)
+
+        drf_list.assert_not_called()
+        drf_retrieve.assert_not_called()
+        return response
+
+    async def test_list(self) -> None:
+        response = await self.get('/api/posts/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([post['slug'] for post in response.json()['results']], [self.post.slug])
+
+    async def test_detail(self) -> None:
+        response = await self.get(f'/api/posts/{self.post.slug}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Hello')
+
+    async def test_not_modified(self) -> None:
+        url = f'/api/posts/{self.post.slug}/'
+        etag = (await self.get(url)).headers['ETag']
+
+        response = await self.get(url, if_none_match=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    async def assertSameErrorAsDRF(self, url: str, params: dict[str, str], status_code: int) -> None:
+        response = await self.get(url, params)
+        # `format` sends the request through PostViewSet
+        drf_response = await self.async_client.get(url, {**params, 'format': 'json'})
+
+        self.assertEqual(response.status_code, status_code)
+        self.assertEqual(drf_response.status_code, status_code)
+        self.assertEqual(response.json(), drf_response.json())
+
+    async def test_missing_post_body(self) -> None:
+        await self.assertSameErrorAsDRF('/api/posts/missing/', {}, 404)
+
+    async def test_filter_error_body(self) -> None:
+        await self.assertSameErrorAsDRF('/api/posts/', {'author': 'first'}, 400)
+
+    async def test_invalid_token_is_left_to_drf(self) -> None:
+        response = await self.async_client.get('/api/posts/', headers={'authorization': 'Bearer invalid'})
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['code'], 'token_not_valid')
+
+
+class SoftDeleteQuerySetTests(TestCase):
+    """Bulk soft deletion, restoration and purging"""
+
+    def setUp(self) -> None:
+        self.tags = list(Tag.objects.resolve(['python', 'django', 'rust']))
+
+    def test_soft_delete_and_restore(self) -> None:
+        self.assertEqual(Tag.objects.filter(name__in=['python', 'django']).soft_delete(), 2)
+        self.assertEqual(list(Tag.objects.values_list('name', flat=True)), ['rust'])
+        self.assertEqual(Tag.all_objects.count(), 3)
+
+        self.assertEqual(Tag.all_objects.restore(), 2)
+        self.assertEqual(Tag.objects.count(), 3)
+        self.assertEqual(Tag.all_objects.restore(), 0)
+
+    def test_delete_and_hard_delete_remove_rows(self) -> None:
+        Tag.objects.filter(name='python').delete()
+        Tag.objects.filter(name='django').hard_delete()
+
+        self.assertEqual(list(Tag.all_objects.values_list('name', flat=True)), ['rust'])
+
+    def test_purge_removes_old_tombstones_only(self) -> None:
+        Tag.objects.filter(name__in=['python', 'django']).soft_delete()
+        Tag.all_objects.filter(name='python').update(deleted_at=timezone.now() - timedelta(days=40))
+
+        Tag.all_objects.purge(older_than=timedelta(days=30))
+
+        self.assertEqual(sorted(Tag.all_objects.values_list('name', flat=True)), ['django', 'rust'])
+
+
+class PurgeDeletedCommandTests(TestCase):
+    """Tombstones purged by the purgedeleted command"""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.author = create_user()
+        self.reader = create_user('Reader')
+
+    def purge(self, *args: str) -> str:
+        output = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('purgedeleted', *args, stdout=output)
+        return output.getvalue()
+
+    def test_batches_purge_old_tombstones(self) -> None:
+        Tag.objects.resolve(['a', 'b', 'c', 'recent', 'live'])
+        Tag.objects.exclude(name='live').soft_delete()
+        Tag.all_objects.exclude(name__in=['recent', 'live']).update(deleted_at=timezone.now() - timedelta(days=40))
+
+        output = self.purge('--model', 'blog.Tag', '--batch-size', '2')
+
+        self.assertIn("blog.Tag: purged 3", output)
+        self.assertEqual(sorted(Tag.all_objects.values_list('name', flat=True)), ['live', 'recent'])
+
+    def test_purged_author_takes_live_rows_along(self) -> None:
+        category = Category.objects.create(name='News')
+        tag = Tag.objects.create(name='django')
+        post = create_post(self.author, 'Mine', category=category)
+        post.tags.add(tag)
+        other_post = create_post(self.reader, 'Theirs')
+        Comment.objects.create(post=other_post, author=self.author, body='Spam')
+        Comment.objects.create(post=other_post, author=self.reader, body='Reply')
+        live_key = LIVE_POST_KEY.format(slug=post.slug)
+        cache.set(live_key, True)
+        CustomUser.all_objects.filter(pk=self.author.pk).update(deleted_at=timezone.now() - timedelta(days=40))
+
+        output = self.purge('--model', 'users.CustomUser')
+
+        self.assertIn("users.CustomUser: purged 1", output)
+        self.assertFalse(Post.all_objects.filter(pk=post.pk).exists())
+        self.assertIsNone(cache.get(live_key))
+        other_post.refresh_from_db()
+        self.assertEqual(other_post.comment_count, 1)
+        category.refresh_from_db()
+        tag.refresh_from_db()
+        self.assertEqual((category.published_post_count, tag.published_post_count), (0, 0))
+
+
+class PostListQueryTests(TestCase):
+    """Queries issued to render the post list"""
+
+    def setUp(self) -> None:
+        self.author = create_user()
+        self.category = Category.objects.create(name='Tech')
+        CategoryTranslations.objects.create(orig_category=self.category, language='ru', name='Техно')
+
+    def create_posts(self, count: int) -> None:
+        for number in range(count):
+            post = create_post(self.author, f'Post {number}', category=self.category)
+            post.tags.set(Tag.objects.resolve([f'tag{number}', 'common']))
+
+    def assertListQueries(self, count: int) -> None:
+        # Renders the page afresh, with category names loaded beforehand
+        # like they are in a warm process
+        cache.clear()
+        category_names.invalidate()
+        category_names.get_names()
+        with self.assertNumQueries(count):
+            response = self.client.get('/api/posts/?lang=ru&page_size=50')
+        self.assertEqual(response.json()['results'][0]['category']['name'], 'Техно')
+
+    def test_query_count_does_not_grow_with_posts(self) -> None:
+        self.create_posts(1)
+        self.assertListQueries(3)
+
+        self.create_posts(10)
+        self.assertListQueries(3)
+
+
+@skipUnless(connection.vendor == 'sqlite', "Plans are checked against SQLite's planner")
+class PostFilterPlanTests(TestCase):
+    """Indexes serving the filtered post feeds"""
+
+    def get_plan(self, **params: str) -> str:
+        request = DRFRequest(APIRequestFactory().get('/api/posts/', params))
+        queryset: QuerySet = PostFilterBackend().filter_queryset(
+            request,
+            Post.objects.filter(status=Post.STATUS_PUBLISHED),
+        )
+        return queryset.order_by('-created_at', '-id')[:21].explain()
+
+    def test_author_filter_uses_author_feed_index(self) -> None:
+        self.assertIn('blog_post_author_feed_idx', self.get_plan(author='1'))
+
+    def test_category_filter_uses_category_feed_index(self) -> None:
+        self.assertIn('blog_post_category_feed_idx', self.get_plan(category='tech'))
+
+    def test_created_filter_uses_feed_index(self) -> None:
+        self.assertIn(
+            'blog_post_alive_feed_idx',
+            self.get_plan(created_after='2024-01-01', created_before='2025-01-01'),
+        )
+
+    def test_tag_filter_uses_through_table_index(self) -> None:
+        for tag_mode in PostFilterBackend.tag_modes:
+            with self.subTest(tag_mode=tag_mode):
+                self.assertRegex(
+                    self.get_plan(tag=['python', 'django'], tag_mode=tag_mode),
+                    r'USING (COVERING )?INDEX blog_post_tags_post_id_tag_id_\w+_uniq',
+                )
+
+    def test_search_count_scans_index_once(self) -> None:
+        queryset = search_posts(Post.objects.filter(status=Post.STATUS_PUBLISHED), 'django', 'en')
+
+        with CaptureQueriesContext(connection) as queries:
+            queryset.count()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {queries[0]['sql']}")
+            plan = [row[-1] for row in cursor.fetchall()]
 
-# Create your tests here.
+        # Posts looked up from the matches, not the match run for every post
+        self.assertRegex(plan[0], r'^SCAN blog_post_fts VIRTUAL TABLE')
+        self.assertRegex(plan[1], r'^SEARCH blog_post USING INTEGER PRIMARY KEY')
@@ -1,13 +1,40 @@
 from django.urls import path
 
 from rest_framework.routers import DefaultRouter
-from apps.blog.views import PostViewSet
+from apps.blog.views import CategoryViewSet, PostViewSet, PostAsyncReadView, TagViewSet
 
 router = DefaultRouter()
 router.register(r'posts', PostViewSet, basename='posts')
+router.register(r'tags', TagViewSet, basename='tags')
+router.register(r'categories', CategoryViewSet, basename='categories')
 
 urlpatterns = [
-    
+    # Shadow the router's list and detail routes with the async read path
+    path(
+        'posts/',
+        PostAsyncReadView.as_view({'get': 'list', 'post': 'create'}),
+        name='posts-list',
+    ),
+    # Keep the detail route below from taking `search` or `import` for a slug
+    path(
+        'posts/search/',
+        PostViewSet.as_view({'get': 'search'}, detail=False, **PostViewSet.search.kwargs),
+        name='posts-search',
+    ),
+    path(
+        'posts/import/',
+        PostViewSet.as_view({'post': 'import_posts'}, detail=False, **PostViewSet.import_posts.kwargs),
+        name='posts-import',
+    ),
+    path(
+        'posts/<slug:slug>/',
+        PostAsyncReadView.as_view({
+            'get': 'retrieve',
+            'patch': 'partial_update',
+            'delete': 'destroy',
+        }),
+        name='posts-detail',
+    ),
 ]
 
 urlpatterns += router.urls
\ No newline at end of file
@@ -1,13 +1,17 @@
-from typing import Any
-from django.http import Http404
+from typing import Any, Callable, Optional
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpRequest, HttpResponse
+from django.db.models import Prefetch, QuerySet
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import get_language
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.mixins import (
     ListModelMixin,
-    CreateModelMixin,
 )
 from rest_framework.request import Request as DRFRequest
 from rest_framework.response import Response as DRFResponse
@@ -18,11 +22,14 @@ from  rest_framework.status import (
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT
 )
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, APIException, ValidationError
+from rest_framework.renderers import JSONRenderer
 
 
-from apps.blog.models import Post, Comment
+from apps.blog.models import Category, Post, Tag
 from apps.blog.serializer import (
+    CategoryListSerializer,
+    TagListSerializer,
     PostBaseSerializer,
     PostListSerializer,
     PostCreateSerializer,
@@ -31,22 +38,97 @@ from apps.blog.serializer import (
     CommentCreateSerializer
 )
 from apps.blog.permissions import IsPostAuthor
+from apps.blog.caches import category_names, post_responses
+from apps.users.models import CustomUser
+from apps.blog.search import search_posts
+from apps.blog.imports import PostImporter
+from apps.blog.filters import PostFilterBackend
+from apps.abstracts.paginations import KeysetCursorPagination, RankedPagePagination
+from apps.abstracts.parsers import NDJSONParser
+from apps.abstracts.conditional import (
+    aget_queryset_validators,
+    get_not_modified_response,
+    get_queryset_validators,
+    set_validator_headers,
+)
+from apps.abstracts.formatters import (
+    LocalDateTimeFormatter,
+    DEFAULT_TIMEZONE,
+    get_request_timezone,
+)
+
+
+def prefetch_post_relations(queryset: QuerySet) -> QuerySet:
+    """Returns posts with the relations PostListSerializer renders preloaded"""
+
+    return queryset.select_related(
+        'author',
+        'category',
+    ).prefetch_related(
+        Prefetch('tags', queryset=Tag.objects.only('id', 'name')),
+    )
+
 
 class PostViewSet(GenericViewSet):
     
-    queryset = Post.objects.all().filter(deleted_at__isnull=True)
+    queryset = Post.objects.all()
     serializer_class = PostBaseSerializer
+    pagination_class = KeysetCursorPagination
+    filter_backends = [PostFilterBackend]
     lookup_field = 'slug'
 
     def list(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[Any,Any]) -> DRFResponse:
-        queryset = self.get_queryset().filter(status=Post.STATUS_PUBLISHED).order_by('-created_at')
-        serializer = PostListSerializer(queryset, many= True, context={'request': request})
-        return DRFResponse(serializer.data)
+        queryset = self.filter_queryset(self.get_queryset()).filter(status=Post.STATUS_PUBLISHED)
+        cache_key = self.get_response_cache_key(request)
+
+        if cache_key is None:
+            page = self.paginate_queryset(queryset)
+            serializer = PostListSerializer(page, many= True, context={'request': request})
+            return self.get_paginated_response(serializer.data)
+
+        entry = post_responses.get(cache_key)
+
+        if entry is None:
+            page_queryset = self.paginator.get_page_queryset(queryset, request)
+            etag, last_modified = get_queryset_validators(page_queryset, cache_key)
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+
+            page = self.paginator.build_page(list(page_queryset))
+            serializer = PostListSerializer(page, many= True, context={'request': request})
+            entry = post_responses.set(
+                cache_key,
+                self.paginator.get_paginated_data(serializer.data),
+                etag,
+                last_modified,
+            )
+
+        return post_responses.build_response(request, entry)
     
     def retrieve(self, request: DRFRequest, *args, **kwargs) -> DRFResponse:
-        post = self.get_object()  
-        serializer = PostListSerializer(post, )
-        return DRFResponse(serializer.data)
+        slug = kwargs[self.lookup_field]
+        cache_key = self.get_response_cache_key(request, slug)
+
+        if cache_key is None:
+            return DRFResponse(PostListSerializer(self.get_object(), context={'request': request}).data)
+
+        entry = post_responses.get(cache_key)
+
+        if entry is None:
+            etag, last_modified = get_queryset_validators(
+                self.get_queryset().filter(**{self.lookup_field: slug}),
+                cache_key,
+            )
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+
+            post = self.get_object()  
+            serializer = PostListSerializer(post, context={'request': request})
+            entry = post_responses.set(cache_key, serializer.data, etag, last_modified)
+
+        return post_responses.build_response(request, entry)
 
     def create(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
         serializer = PostCreateSerializer(data=request.data)
@@ -61,7 +143,7 @@ class PostViewSet(GenericViewSet):
 
 
         return DRFResponse(
-            data=PostListSerializer(post).data,
+            data=PostListSerializer(post, context={'request': request}).data,
             status=HTTP_201_CREATED
         )
 
@@ -79,7 +161,7 @@ class PostViewSet(GenericViewSet):
         post = serializer.save()
 
         return DRFResponse(
-                data=PostListSerializer(post).data,
+                data=PostListSerializer(post, context={'request': request}).data,
                 status=HTTP_200_OK
         )
 
@@ -98,12 +180,27 @@ class PostViewSet(GenericViewSet):
         post = self.get_object()
 
         if request.method == 'GET':
-            comments = Comment.objects.filter(
-                post=post,
-                deleted_at__isnull=True
-            ).order_by('-created_at')
-            serializer = CommentListSerializer(comments, many=True)
-            return DRFResponse(serializer.data)
+            # The related manager hands the loaded post to every comment,
+            # so rendering `post.slug` costs no query.
+            comments = post.post.select_related('author')
+            paginator = self.paginator
+            page_queryset = paginator.get_page_queryset(comments, request)
+            etag, last_modified = get_queryset_validators(
+                page_queryset,
+                post.pk,
+                post.slug,
+                request.build_absolute_uri(),
+                get_language(),
+                get_request_timezone(request),
+            )
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+
+            page = paginator.build_page(list(page_queryset))
+            serializer = CommentListSerializer(page, many=True)
+            response = paginator.get_paginated_response(serializer.data)
+            return set_validator_headers(response, etag, last_modified)
 
         # POST
         serializer = CommentCreateSerializer(data=request.data)
@@ -117,11 +214,73 @@ class PostViewSet(GenericViewSet):
         serializer.save(author=request.user, post=post)
         return DRFResponse(serializer.data, status=HTTP_201_CREATED)
 
+    @action(
+        detail=False,
+        methods=['GET'],
+        url_path='search',
+        pagination_class=RankedPagePagination,
+    )
+    def search(self, request: DRFRequest) -> DRFResponse:
+        """Published posts matching `q` in title or body, most relevant first"""
+
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            raise ValidationError({'q': _("This query parameter is required.")})
+
+        queryset = search_posts(
+            self.filter_queryset(self.get_queryset()).filter(status=Post.STATUS_PUBLISHED),
+            query,
+            get_language(),
+        )
+        page = self.paginate_queryset(queryset)
+        serializer = PostListSerializer(page, many=True, context={'request': request})
+        return self.get_paginated_response(serializer.data)
+
+    @action(
+        detail=False,
+        methods=['POST'],
+        url_path='import',
+        parser_classes=[NDJSONParser],
+        permission_classes=[IsAuthenticated],
+    )
+    def import_posts(self, request: DRFRequest) -> DRFResponse:
+        """
+        Imports posts streamed as NDJSON, authored by the user. Staff users
+        may name other authors by email.
+        """
+
+        importer = PostImporter(default_author=request.user, allow_author=request.user.is_staff)
+        report = importer.run(request.data)
+        return DRFResponse(report.as_dict(), status=HTTP_200_OK)
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()
+
+        if self.action not in ('list', 'retrieve', 'search'):
+            return queryset
+
+        return prefetch_post_relations(queryset)
+
+    def get_response_cache_key(self, request: DRFRequest, slug: Optional[str] = None) -> Optional[str]:
+        """Returns response cache key, or None for non-JSON renderings"""
+
+        if request.accepted_renderer.format != 'json':
+            return None
+
+        return post_responses.get_key(
+            request.query_params,
+            get_language(),
+            get_request_timezone(request),
+            slug,
+        )
+
     def get_permissions(self):
         if self.action in ['partial_update', 'destroy']:
             return [IsAuthenticatedOrReadOnly(), IsPostAuthor()]
         if self.action in ['create', 'comments']:
             return [IsAuthenticatedOrReadOnly()]
+        if self.action == 'import_posts':
+            return [IsAuthenticated()]
         return [IsAuthenticatedOrReadOnly()]
     
 
@@ -129,4 +288,151 @@ class PostViewSet(GenericViewSet):
         try:
             return super().get_object()
         except Http404:
-            raise NotFound(_("Post not found"))
\ No newline at end of file
+            raise NotFound(_("Post not found"))
+
+
+class PostAsyncReadView(View):
+    """
+    Serves GET of the post list and detail with Django's async ORM, so
+    the read path runs on the event loop instead of a sync thread.
+
+    Other methods, and requests whose credentials DRF has to reject, are
+    handed over to PostViewSet.
+    """
+
+    viewset_view: Optional[Callable] = None
+    chunk_size = KeysetCursorPagination.max_page_size + 1
+
+    @classmethod
+    def as_view(cls, actions: dict[str, str], **initkwargs: Any) -> Callable:
+        viewset_view = PostViewSet.as_view(actions)
+        view = csrf_exempt(super().as_view(viewset_view=viewset_view, **initkwargs))
+
+        # Lets drf-spectacular document the endpoint through the viewset
+        view.cls = viewset_view.cls
+        view.initkwargs = viewset_view.initkwargs
+        view.actions = viewset_view.actions
+
+        return view
+
+    async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        if request.method == 'GET' and self.accepts_json(request):
+            tz_name = await self.get_timezone(request)
+            if tz_name is not None:
+                try:
+                    return await self.get(request, tz_name, *args, **kwargs)
+                except APIException as exc:
+                    # Same body DRF's exception handler would render
+                    data = exc.detail if isinstance(exc.detail, (dict, list)) else {'detail': exc.detail}
+                    return self.render(data, status=exc.status_code)
+
+        return await sync_to_async(self.viewset_view)(request, *args, **kwargs)
+
+    async def get(self, request: HttpRequest, tz_name: str, slug: Optional[str] = None) -> HttpResponse:
+        language = get_language()
+        cache_key = await post_responses.aget_key(request.GET, language, tz_name, slug)
+        entry = await post_responses.aget(cache_key)
+
+        if entry is None:
+            drf_request = DRFRequest(request)
+            queryset = prefetch_post_relations(PostViewSet.queryset)
+
+            if slug is None:
+                paginator = KeysetCursorPagination()
+                queryset = PostFilterBackend().filter_queryset(drf_request, queryset)
+                queryset = paginator.get_page_queryset(
+                    queryset.filter(status=Post.STATUS_PUBLISHED),
+                    drf_request,
+                )
+            else:
+                queryset = queryset.filter(slug=slug)
+
+            etag, last_modified = await aget_queryset_validators(queryset, cache_key)
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+
+            context = {
+                'request': drf_request,
+                'datetime_formatter': LocalDateTimeFormatter(language, tz_name),
+                'category_names': await category_names.aget_names(),
+            }
+
+            if slug is None:
+                page = paginator.build_page(
+                    [post async for post in queryset.aiterator(chunk_size=self.chunk_size)]
+                )
+                serializer = PostListSerializer(page, many=True, context=context)
+                data = paginator.get_paginated_data(serializer.data)
+            else:
+                post = await queryset.afirst()
+                if post is None:
+                    raise NotFound(_("Post not found"))
+                data = PostListSerializer(post, context=context).data
+
+            entry = await post_responses.aset(cache_key, data, etag, last_modified)
+
+        return post_responses.build_response(request, entry)
+
+    @staticmethod
+    def accepts_json(request: HttpRequest) -> bool:
+        """Browsable API renderings are left to DRF"""
+
+        return 'format' not in request.GET and 'text/html' not in request.headers.get('Accept', '')
+
+    @staticmethod
+    async def get_timezone(request: HttpRequest) -> Optional[str]:
+        """
+        Returns timezone of the viewer, or None when the request has to
+        go through DRF authentication.
+        """
+
+        token = getattr(request, 'validated_token', None)
+        if token is None:
+            if 'Authorization' in request.headers:
+                return None
+
+            user = await request.auser()
+            return user.timezone if user.is_authenticated else DEFAULT_TIMEZONE
+
+        return await CustomUser.objects.filter(
+            pk=token.get('user_id'),
+            is_active=True,
+        ).values_list('timezone', flat=True).afirst()
+
+    @staticmethod
+    def render(data: Any, status: int = HTTP_200_OK) -> HttpResponse:
+        return HttpResponse(
+            JSONRenderer().render(data),
+            content_type='application/json',
+            status=status,
+        )
+
+
+
+class TagViewSet(ListModelMixin, GenericViewSet):
+    """Tags ordered by how many published posts use them"""
+
+    queryset = Tag.objects.only('name', 'slug', 'published_post_count').order_by(
+        '-published_post_count', 'name',
+    )
+    serializer_class = TagListSerializer
+    pagination_class = RankedPagePagination
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+
+class CategoryViewSet(ListModelMixin, GenericViewSet):
+    """Categories with localized names, ordered by published posts in them"""
+
+    queryset = Category.objects.only('name', 'slug', 'published_post_count').order_by(
+        '-published_post_count', 'name',
+    )
+    serializer_class = CategoryListSerializer
+    pagination_class = RankedPagePagination
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    def get_serializer_context(self) -> dict[str, Any]:
+        return {
+            **super().get_serializer_context(),
+            'category_names': category_names.get_names(),
+        }
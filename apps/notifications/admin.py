@@ -0,0 +1,16 @@
+from django.contrib.admin import (
+    register,
+    ModelAdmin
+)
+from apps.notifications.models import OutgoingEmail
+
+@register(OutgoingEmail)
+class OutgoingEmailAdmin(ModelAdmin):
+    list_display = (
+        "recipient",
+        "subject",
+        "status",
+        "attempts",
+        "next_attempt_at",
+    )
+    list_filter = ("status",)
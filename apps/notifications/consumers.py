@@ -1,35 +1,40 @@
 import json
 
-from asgiref.sync import async_to_sync 
-from channels.generic.websocket import WebsocketConsumer
+from channels.generic.websocket import AsyncWebsocketConsumer
 
-from apps.blog.models import Post
+from apps.blog.caches import ais_post_live
 
-class CommentsConsumer(WebsocketConsumer):
-    def connect(self):
+class CommentsConsumer(AsyncWebsocketConsumer):
+    async def connect(self):
         self.post_slug = self.scope["url_route"]["kwargs"]["slug"]        
         self.post_group_name = f"post_{self.post_slug}"
+        self.joined = False
 
-        exists = Post.objects.filter(slug=self.post_slug, deleted_at__isnull=True).exists()
-
-        self.accept()
-        
-        if not exists:
-            self.close(code=4004)
+        # Unknown posts are rejected during the handshake
+        if not await ais_post_live(self.post_slug):
+            await self.close(code=4004)
             return
 
-        async_to_sync(self.channel_layer.group_add)(
+        await self.channel_layer.group_add(
             self.post_group_name, self.channel_name
         )
+        self.joined = True
+
+        await self.accept()
 
- 
+    async def disconnect(self, close_code):
+        if not self.joined:
+            return
 
-    def disconnect(self, close_code):
-        async_to_sync(self.channel_layer.group_discard)(
+        await self.channel_layer.group_discard(
             self.post_group_name, self.channel_name
         )
     
-    def post_comment(self, event):
+    async def post_comment(self, event):
         message = event["message"]
 
-        self.send(text_data=json.dumps({"message": message}))
\ No newline at end of file
+        await self.send(text_data=json.dumps({"message": message}))
+
+    async def post_comment_batch(self, event):
+        # Serialized once by the dispatcher for every subscriber
+        await self.send(text_data=event["text"])
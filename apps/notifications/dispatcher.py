@@ -0,0 +1,238 @@
+# Python modules
+import asyncio
+import json
+import logging
+from os import getpid
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, Callable, Optional
+
+# Django modules
+from django.conf import settings
+from channels.layers import BaseChannelLayer, get_channel_layer
+
+logger = logging.getLogger(__name__)
+
+
+class BroadcastDispatcher:
+    """
+    Sends channel layer group events from a background thread.
+
+    Requests only put events into a bounded queue. A daemon thread with its
+    own event loop drains the queue and sends whatever has piled up as one
+    concurrent batch of `group_send` calls, so a slow channel layer delays
+    broadcasts instead of the writes that caused them.
+
+    When the queue is full, the caller waits up to ENQUEUE_TIMEOUT for room
+    (counted as delayed) and then gives the event up (counted as dropped).
+    A worker thread found dead is replaced by the next enqueue (counted as
+    restarted); events it had taken from the queue are lost.
+
+    With a coalescing window, events of a group are held for up to the
+    window (or until `coalesce_size` of them arrive) and handed to
+    `coalesce`, which merges them into the single event that is sent.
+    """
+
+    def __init__(
+        self,
+        queue_size: int,
+        batch_size: int,
+        enqueue_timeout: float,
+        coalesce: Optional[Callable[[list[dict[str, Any]]], dict[str, Any]]] = None,
+        coalesce_window: float = 0,
+        coalesce_size: int = 1,
+    ) -> None:
+        self.batch_size = batch_size
+        self.enqueue_timeout = enqueue_timeout
+        self.coalesce = coalesce if coalesce_window > 0 else None
+        self.coalesce_window = coalesce_window
+        self.coalesce_size = coalesce_size
+        self._queue: Queue = Queue(maxsize=queue_size)
+        self._thread: Optional[Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = Lock()
+        self._counters = dict.fromkeys(
+            ('queued', 'sent', 'coalesced', 'delayed', 'dropped', 'failed', 'restarted'),
+            0,
+        )
+
+    def enqueue(self, group: str, event: dict[str, Any]) -> bool:
+        """Queues the event for the group, returns False when it was dropped"""
+
+        if not self._ensure_started():
+            self._increment('dropped')
+            return False
+
+        try:
+            self._queue.put_nowait((group, event))
+        except Full:
+            self._increment('delayed')
+            try:
+                self._queue.put((group, event), timeout=self.enqueue_timeout)
+            except Full:
+                self._increment('dropped')
+                logger.warning("Broadcast queue is full, dropped event for %s", group)
+                return False
+
+        self._increment('queued')
+        return True
+
+    def get_counters(self) -> dict[str, int]:
+        """Returns a snapshot of the counters and the current queue length"""
+
+        with self._lock:
+            counters = dict(self._counters)
+        counters['pending'] = self._queue.qsize()
+        return counters
+
+    def _increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += value
+
+    def _ensure_started(self) -> bool:
+        """Starts the worker in this process, False without a channel layer"""
+
+        pid = getpid()
+        if self._is_running(pid):
+            return True
+
+        with self._lock:
+            if self._is_running(pid):
+                return True
+
+            channel_layer: BaseChannelLayer | None = get_channel_layer()
+            if channel_layer is None:
+                return False
+
+            # A forked worker inherits the queue but not the thread
+            if self._pid != pid:
+                self._queue = Queue(maxsize=self._queue.maxsize)
+            elif self._thread is not None:
+                self._counters['restarted'] += 1
+                logger.error("Broadcast dispatcher thread has died, starting a new one")
+
+            self._thread = Thread(
+                target=self._run,
+                args=(channel_layer,),
+                name='broadcast-dispatcher',
+                daemon=True,
+            )
+            self._pid = pid
+            self._thread.start()
+            return True
+
+    def _is_running(self, pid: int) -> bool:
+        return self._pid == pid and self._thread is not None and self._thread.is_alive()
+
+    def _run(self, channel_layer: BaseChannelLayer) -> None:
+        # One loop for the whole life of the thread keeps the channel
+        # layer's connections reusable between batches.
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        held: dict[str, list[dict[str, Any]]] = {}
+        deadlines: dict[str, float] = {}
+
+        while True:
+            try:
+                self._dispatch(loop, channel_layer, held, deadlines)
+            except Exception:
+                # The events being handled are lost, the thread carries on
+                self._increment('failed')
+                logger.exception("Broadcast dispatcher failed to handle a batch")
+
+    def _dispatch(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        channel_layer: BaseChannelLayer,
+        held: dict[str, list[dict[str, Any]]],
+        deadlines: dict[str, float],
+    ) -> None:
+        """Waits for events and sends what is due, the body of the worker loop"""
+
+        timeout = max(min(deadlines.values()) - monotonic(), 0) if deadlines else None
+        try:
+            received = [self._queue.get(timeout=timeout)]
+        except Empty:
+            received = []
+
+        while len(received) < self.batch_size:
+            try:
+                received.append(self._queue.get_nowait())
+            except Empty:
+                break
+
+        if self.coalesce is None:
+            loop.run_until_complete(self._send(channel_layer, received))
+            return
+
+        batch = []
+        for group, event in received:
+            events = held.setdefault(group, [])
+            if not events:
+                deadlines[group] = monotonic() + self.coalesce_window
+            events.append(event)
+            if len(events) >= self.coalesce_size:
+                batch.append(self._release(group, held, deadlines))
+
+        now = monotonic()
+        for group, deadline in list(deadlines.items()):
+            if deadline <= now:
+                batch.append(self._release(group, held, deadlines))
+
+        if batch:
+            loop.run_until_complete(self._send(channel_layer, batch))
+
+    def _release(
+        self,
+        group: str,
+        held: dict[str, list[dict[str, Any]]],
+        deadlines: dict[str, float],
+    ) -> tuple[str, dict[str, Any]]:
+        """Merges events held for the group into one"""
+
+        events = held.pop(group)
+        del deadlines[group]
+        self._increment('coalesced', len(events))
+        return group, self.coalesce(events)
+
+    async def _send(self, channel_layer: BaseChannelLayer, batch: list[tuple[str, dict[str, Any]]]) -> None:
+        results = await asyncio.gather(
+            *(channel_layer.group_send(group, event) for group, event in batch),
+            return_exceptions=True,
+        )
+
+        failed = 0
+        for (group, _), result in zip(batch, results):
+            if isinstance(result, Exception):
+                failed += 1
+                logger.error("Broadcast to %s failed", group, exc_info=result)
+
+        self._increment('sent', len(batch) - failed)
+        if failed:
+            self._increment('failed', failed)
+
+
+def coalesce_comment_events(events: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Merges `post.comment` events into one `post.comment.batch` event.
+
+    The frame is serialized here once, so consumers send it to every
+    subscriber as is. It is an array of the frames sent for single events.
+    """
+
+    return {
+        "type": "post.comment.batch",
+        "text": json.dumps([{"message": event["message"]} for event in events]),
+    }
+
+
+comment_broadcasts = BroadcastDispatcher(
+    queue_size=settings.COMMENT_BROADCAST['QUEUE_SIZE'],
+    batch_size=settings.COMMENT_BROADCAST['BATCH_SIZE'],
+    enqueue_timeout=settings.COMMENT_BROADCAST['ENQUEUE_TIMEOUT'],
+    coalesce=coalesce_comment_events,
+    coalesce_window=settings.COMMENT_BROADCAST['COALESCE_WINDOW'],
+    coalesce_size=settings.COMMENT_BROADCAST['COALESCE_MAX_EVENTS'],
+)
@@ -0,0 +1,134 @@
+# Python modules
+from datetime import timedelta
+from time import sleep
+from typing import Any
+
+# Django modules
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+# Project modules
+from apps.notifications.models import OutgoingEmail
+
+# Emails claimed by a worker are hidden from others for this long
+CLAIM_TIMEOUT = timedelta(minutes=5)
+RETRY_BASE_DELAY = timedelta(seconds=30)
+RETRY_MAX_DELAY = timedelta(hours=6)
+
+
+class Command(BaseCommand):
+    help = "Delivers emails queued in the outbox"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--max-attempts', type=int, default=8)
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5.0,
+            help="Seconds to wait when the outbox is empty",
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help="Exit once nothing is due instead of polling",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # One connection serves every batch while there is mail to send
+        connection = get_connection()
+
+        try:
+            while True:
+                emails = self.claim(options['batch_size'])
+
+                if emails:
+                    self.deliver(connection, emails, options['max_attempts'])
+                    continue
+
+                connection.close()
+                if options['once']:
+                    return
+                sleep(options['interval'])
+        finally:
+            connection.close()
+
+    @staticmethod
+    def claim(batch_size: int) -> list[OutgoingEmail]:
+        """Takes due emails and hides them from other workers for a while"""
+
+        now = timezone.now()
+
+        with transaction.atomic():
+            emails = list(
+                OutgoingEmail.objects.select_for_update(skip_locked=True).filter(
+                    status=OutgoingEmail.STATUS_PENDING,
+                    next_attempt_at__lte=now,
+                ).order_by('next_attempt_at')[:batch_size]
+            )
+            OutgoingEmail.objects.filter(
+                pk__in=[email.pk for email in emails]
+            ).update(next_attempt_at=now + CLAIM_TIMEOUT)
+
+        return emails
+
+    def deliver(
+        self,
+        connection: BaseEmailBackend,
+        emails: list[OutgoingEmail],
+        max_attempts: int,
+    ) -> None:
+        """Sends the batch over the open connection and records outcomes"""
+
+        sent: list[OutgoingEmail] = []
+
+        for email in emails:
+            message = EmailMessage(
+                subject=email.subject,
+                body=email.html_message,
+                from_email=email.from_email,
+                to=[email.recipient],
+                connection=connection,
+            )
+            message.content_subtype = 'html'
+
+            try:
+                # Opening a connection that is already open is a no-op, and
+                # an open connection isn't closed by send_messages.
+                connection.open()
+                connection.send_messages([message])
+            except Exception as exc:
+                connection.close()
+                self.retry(email, exc, max_attempts)
+                continue
+
+            sent.append(email)
+
+        now = timezone.now()
+        OutgoingEmail.objects.filter(pk__in=[email.pk for email in sent]).update(
+            status=OutgoingEmail.STATUS_SENT,
+            attempts=F('attempts') + 1,
+            sent_at=now,
+            updated_at=now,
+        )
+
+        self.stdout.write(f"Sent {len(sent)} of {len(emails)} emails")
+
+    def retry(self, email: OutgoingEmail, exc: Exception, max_attempts: int) -> None:
+        """Schedules the next attempt with exponential backoff, or gives up"""
+
+        email.attempts += 1
+        email.last_error = repr(exc)
+
+        if email.attempts >= max_attempts:
+            email.status = OutgoingEmail.STATUS_FAILED
+            self.stderr.write(f"Giving up on email {email.pk}: {exc!r}")
+        else:
+            delay = min(RETRY_BASE_DELAY * 2 ** (email.attempts - 1), RETRY_MAX_DELAY)
+            email.next_attempt_at = timezone.now() + delay
+
+        email.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at', 'updated_at'])
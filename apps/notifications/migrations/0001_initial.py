@@ -0,0 +1,36 @@
+# Generated by Django 6.0.1 on 2026-10-18 17:50
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutgoingEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('subject', models.CharField(max_length=255)),
+                ('html_message', models.TextField()),
+                ('from_email', models.EmailField(max_length=254)),
+                ('recipient', models.EmailField(max_length=254)),
+                ('status', models.CharField(choices=[('pend', 'pending'), ('sent', 'sent'), ('fail', 'failed')], default='pend')),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_error', models.TextField(blank=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='notif_outbox_due_idx')],
+            },
+        ),
+    ]
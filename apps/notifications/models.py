@@ -0,0 +1,59 @@
+# Django modules
+from django.db import models
+from django.db.models import (
+    CharField,
+    DateTimeField,
+    EmailField,
+    PositiveSmallIntegerField,
+    TextField,
+)
+from django.utils import timezone
+
+# Project modules
+from apps.abstracts.models import AbstractBaseModel
+
+
+class OutgoingEmail(AbstractBaseModel):
+    """
+    Email waiting in the outbox.
+
+    Rows are written in the transaction of whatever caused the email and
+    delivered later by the `sendemails` command, so requests never wait
+    on the mail server.
+    """
+
+    SUBJECT_MAX_LEN = 255
+    STATUS_PENDING = "pend"
+    STATUS_PENDING_LABEL = "pending"
+    STATUS_SENT = "sent"
+    STATUS_SENT_LABEL = "sent"
+    STATUS_FAILED = "fail"
+    STATUS_FAILED_LABEL = "failed"
+    TEXT_CHOICES = {
+        STATUS_PENDING: STATUS_PENDING_LABEL,
+        STATUS_SENT: STATUS_SENT_LABEL,
+        STATUS_FAILED: STATUS_FAILED_LABEL,
+    }
+
+    subject = CharField(max_length=SUBJECT_MAX_LEN)
+    html_message = TextField()
+    from_email = EmailField()
+    recipient = EmailField()
+    status = CharField(choices=TEXT_CHOICES, default=STATUS_PENDING)
+    attempts = PositiveSmallIntegerField(default=0)
+    next_attempt_at = DateTimeField(default=timezone.now)
+    last_error = TextField(blank=True)
+    sent_at = DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Serves the worker's scan for emails that are due
+            models.Index(
+                fields=['status', 'next_attempt_at'],
+                name='notif_outbox_due_idx',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Returns the string representation of the email"""
+        return f"{self.recipient}: {self.subject}"
@@ -0,0 +1,88 @@
+# Python modules
+from time import monotonic, sleep
+from typing import Any
+from unittest.mock import patch
+
+# Django modules
+from channels.layers import InMemoryChannelLayer
+from django.test import SimpleTestCase
+
+# Project modules
+from apps.notifications.dispatcher import BroadcastDispatcher
+
+
+class BroadcastDispatcherTests(SimpleTestCase):
+    """Queueing, counters and survival of the broadcast worker"""
+
+    def setUp(self) -> None:
+        patcher = patch(
+            'apps.notifications.dispatcher.get_channel_layer',
+            return_value=InMemoryChannelLayer(),
+        )
+        self.get_channel_layer = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_dispatcher(self, **kwargs: Any) -> BroadcastDispatcher:
+        options = {'queue_size': 10, 'batch_size': 10, 'enqueue_timeout': 0.01, **kwargs}
+        return BroadcastDispatcher(**options)
+
+    def wait_for(self, dispatcher: BroadcastDispatcher, name: str, value: int) -> None:
+        deadline = monotonic() + 5
+        while dispatcher.get_counters()[name] < value and monotonic() < deadline:
+            sleep(0.01)
+        self.assertEqual(dispatcher.get_counters()[name], value)
+
+    def test_full_queue_delays_then_drops(self) -> None:
+        dispatcher = self.create_dispatcher(queue_size=1)
+
+        # Without a worker nothing leaves the queue
+        with patch.object(BroadcastDispatcher, '_ensure_started', return_value=True):
+            self.assertTrue(dispatcher.enqueue('post_hello', {'type': 'post.comment'}))
+            with self.assertLogs('apps.notifications.dispatcher', 'WARNING'):
+                self.assertFalse(dispatcher.enqueue('post_hello', {'type': 'post.comment'}))
+
+        counters = dispatcher.get_counters()
+        self.assertEqual(
+            (counters['queued'], counters['delayed'], counters['dropped'], counters['pending']),
+            (1, 1, 1, 1),
+        )
+
+    def test_without_channel_layer_events_are_dropped(self) -> None:
+        self.get_channel_layer.return_value = None
+        dispatcher = self.create_dispatcher()
+
+        self.assertFalse(dispatcher.enqueue('post_hello', {'type': 'post.comment'}))
+
+        self.assertEqual(dispatcher.get_counters()['dropped'], 1)
+        self.assertIsNone(dispatcher._thread)
+
+    def test_dead_worker_is_restarted(self) -> None:
+        dispatcher = self.create_dispatcher()
+        with patch.object(BroadcastDispatcher, '_run', return_value=None):
+            dispatcher._ensure_started()
+        dispatcher._thread.join()
+
+        with self.assertLogs('apps.notifications.dispatcher', 'ERROR'):
+            self.assertTrue(dispatcher.enqueue('post_hello', {'type': 'post.comment'}))
+
+        self.wait_for(dispatcher, 'sent', 1)
+        self.assertEqual(dispatcher.get_counters()['restarted'], 1)
+
+    def test_worker_survives_failing_batch(self) -> None:
+        coalesce_calls = []
+
+        def coalesce(events: list[dict[str, Any]]) -> dict[str, Any]:
+            coalesce_calls.append(events)
+            if len(coalesce_calls) == 1:
+                raise ValueError("Unexpected event")
+            return events[0]
+
+        dispatcher = self.create_dispatcher(coalesce=coalesce, coalesce_window=0.01, coalesce_size=1)
+
+        with self.assertLogs('apps.notifications.dispatcher', 'ERROR'):
+            dispatcher.enqueue('post_hello', {'type': 'post.comment'})
+            self.wait_for(dispatcher, 'failed', 1)
+        dispatcher.enqueue('post_hello', {'type': 'post.comment'})
+
+        self.wait_for(dispatcher, 'sent', 1)
+        self.assertTrue(dispatcher._thread.is_alive())
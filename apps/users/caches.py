@@ -0,0 +1,136 @@
+# Python modules
+from threading import Lock
+from time import monotonic, time
+from typing import Optional
+
+# Django modules
+from django.core.cache import cache
+from rest_framework_simplejwt.settings import api_settings
+
+# Project modules
+from apps.users.models import CustomUser
+
+PREFERRED_LANGUAGE_KEY = 'users:preferred-language:{user_id}'
+PREFERRED_LANGUAGE_TIMEOUT = 300
+# Access tokens issued before a change carry the old language claim, the
+# entry stored on save has to outlive them
+CHANGED_LANGUAGE_TIMEOUT = int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+
+
+def get_preferred_language(user_id: int) -> Optional[str]:
+    """Returns user's preferred language, reading the database on cache miss"""
+
+    key = PREFERRED_LANGUAGE_KEY.format(user_id=user_id)
+    language: Optional[str] = cache.get(key)
+
+    if language is None:
+        language = CustomUser.objects.filter(pk=user_id).values_list(
+            'preferred_language', flat=True
+        ).first()
+        if language is not None:
+            cache.set(key, language, PREFERRED_LANGUAGE_TIMEOUT)
+
+    return language
+
+
+async def aget_preferred_language(user_id: int) -> Optional[str]:
+    """Async version of get_preferred_language"""
+
+    key = PREFERRED_LANGUAGE_KEY.format(user_id=user_id)
+    language: Optional[str] = await cache.aget(key)
+
+    if language is None:
+        language = await CustomUser.objects.filter(pk=user_id).values_list(
+            'preferred_language', flat=True
+        ).afirst()
+        if language is not None:
+            await cache.aset(key, language, PREFERRED_LANGUAGE_TIMEOUT)
+
+    return language
+
+
+def get_cached_preferred_language(user_id: int) -> Optional[str]:
+    """Returns user's preferred language if it is cached, never reads the database"""
+
+    return cache.get(PREFERRED_LANGUAGE_KEY.format(user_id=user_id))
+
+
+async def aget_cached_preferred_language(user_id: int) -> Optional[str]:
+    """Async version of get_cached_preferred_language"""
+
+    return await cache.aget(PREFERRED_LANGUAGE_KEY.format(user_id=user_id))
+
+
+class LanguageChangeStamp:
+    """
+    Time of the latest change of any user's preferred language.
+
+    Access tokens issued after it carry a current language claim, so the
+    language middleware trusts them without a cache lookup. Every process
+    keeps a copy of the stamp and reads the shared one again once it is
+    CHECK_INTERVAL seconds old, so a change made by another process reaches
+    it with that delay.
+    """
+
+    KEY = 'users:language-changed-at'
+    CHECK_INTERVAL = 5.0
+
+    def __init__(self) -> None:
+        self._stamp: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = Lock()
+
+    def get(self) -> float:
+        """Returns the stamp as a UNIX time, 0 if nothing changed lately"""
+
+        if self._is_fresh():
+            return self._stamp
+        return self._remember(cache.get(self.KEY, 0.0))
+
+    async def aget(self) -> float:
+        """Async version of get"""
+
+        if self._is_fresh():
+            return self._stamp
+        return self._remember(await cache.aget(self.KEY, 0.0))
+
+    def touch(self) -> None:
+        """Stamps a language change made now"""
+
+        stamp = time()
+        # Tokens issued before the change expire together with the stamp
+        cache.set(self.KEY, stamp, CHANGED_LANGUAGE_TIMEOUT)
+        self._remember(stamp)
+
+    def clear(self) -> None:
+        """Drops the copy of this process, the next get reads the shared stamp"""
+
+        with self._lock:
+            self._stamp = None
+
+    def _is_fresh(self) -> bool:
+        return self._stamp is not None and monotonic() - self._checked_at < self.CHECK_INTERVAL
+
+    def _remember(self, stamp: float) -> float:
+        with self._lock:
+            self._stamp = stamp
+            self._checked_at = monotonic()
+        return stamp
+
+
+language_changes = LanguageChangeStamp()
+
+
+def set_preferred_language(user: CustomUser, created: bool = False) -> None:
+    """
+    Stores user's current preferred language in the cache. A language
+    different from the cached one is stamped as changed, tokens issued
+    before that carry a stale claim.
+    """
+
+    key = PREFERRED_LANGUAGE_KEY.format(user_id=user.pk)
+    previous: Optional[str] = cache.get(key)
+    cache.set(key, user.preferred_language, CHANGED_LANGUAGE_TIMEOUT)
+
+    if not created and previous != user.preferred_language:
+        language_changes.touch()
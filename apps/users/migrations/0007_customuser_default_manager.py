@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-18 17:52
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_alter_customuser_preferred_language'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='customuser',
+            options={'default_manager_name': 'objects', 'ordering': ['-created_at'], 'verbose_name': 'Custom User', 'verbose_name_plural': 'Custom Users'},
+        ),
+    ]
@@ -192,6 +192,7 @@ class CustomUser(AbstractBaseUser, PermissionsMixin, AbstractBaseModel):
         verbose_name = "Custom User"
         verbose_name_plural = "Custom Users"
         ordering = ["-created_at"]
+        default_manager_name = "objects"
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
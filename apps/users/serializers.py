@@ -5,8 +5,10 @@ from rest_framework.serializers import (
     CharField,
     ValidationError
 )
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 
 from apps.users.models import CustomUser
+from apps.users.tokens import LocalizedRefreshToken
 
 class CustomUserRegisterSerializer(ModelSerializer):    
     password = CharField(write_only=True)
@@ -67,4 +69,18 @@ class CustomUserLocalizationSerializer(ModelSerializer):
             raise ValidationError(f"Invalid timezone: {value}")
         
         return value
-    
\ No newline at end of file
+
+
+class LocalizedTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Token pair serializer issuing tokens with preferred language claim
+    """
+    token_class = LocalizedRefreshToken
+
+
+class LocalizedTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Token refresh serializer issuing access tokens with the current
+    preferred language claim
+    """
+    token_class = LocalizedRefreshToken
@@ -0,0 +1,22 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+# Project modules
+from apps.users.models import CustomUser
+from apps.users.caches import set_preferred_language
+
+
+@receiver(post_save, sender=CustomUser)
+def refresh_preferred_language(
+    sender: type,
+    instance: CustomUser,
+    created: bool,
+    **kwargs: dict[str, Any],
+) -> None:
+    """Keeps cached preferred language in line with the saved user"""
+
+    set_preferred_language(instance, created)
@@ -1,3 +1,61 @@
+# Python modules
+from unittest.mock import patch
+
+# Django modules
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+# Project modules
+from apps.users.caches import language_changes
+from apps.users.models import CustomUser
+
+
+class PreferredLanguageTests(TestCase):
+    """Language of requests authenticated with tokens issued before a change"""
+
+    def setUp(self) -> None:
+        cache.clear()
+        language_changes.clear()
+        CustomUser.objects.create_user(
+            email='reader@example.com',
+            first_name='Reader',
+            last_name='Example',
+            password='pass12345xx',
+        )
+        self.client = APIClient()
+        self.tokens = self.client.post(
+            '/api/auth/token',
+            {'email': 'reader@example.com', 'password': 'pass12345xx'},
+        ).data
+
+    def get_language(self, access: str) -> str:
+        response = self.client.get('/api/auth/localization', HTTP_AUTHORIZATION=f'Bearer {access}')
+        return response.headers['Content-Language']
+
+    def change_language(self, language: str) -> None:
+        self.client.patch(
+            '/api/auth/localization',
+            {'preferred_language': language},
+            HTTP_AUTHORIZATION=f"Bearer {self.tokens['access']}",
+        )
+
+    def test_current_claim_is_read_without_cache_lookup(self) -> None:
+        with patch('apps.abstracts.middlewares.get_cached_preferred_language') as get_cached:
+            self.assertEqual(self.get_language(self.tokens['access']), CustomUser.EN)
+
+        get_cached.assert_not_called()
+
+    def test_change_applies_to_issued_access_token(self) -> None:
+        self.change_language(CustomUser.RU)
+
+        self.assertEqual(self.get_language(self.tokens['access']), CustomUser.RU)
+
+    def test_refresh_issues_access_token_with_new_language(self) -> None:
+        self.change_language(CustomUser.RU)
+        # The access token must carry the change once the cache is gone
+        cache.clear()
+
+        access = self.client.post('/api/auth/token/refresh', {'refresh': self.tokens['refresh']}).data['access']
 
-# Create your tests here.
+        self.assertEqual(self.get_language(access), CustomUser.RU)
@@ -0,0 +1,40 @@
+# Python modules
+from typing import Any, Optional
+
+# Django modules
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, Token
+
+# Project modules
+from apps.users.models import CustomUser
+from apps.users.caches import get_preferred_language
+
+LANGUAGE_CLAIM = 'lang'
+
+
+class LocalizedRefreshToken(RefreshToken):
+    """
+    Refresh token carrying the user's preferred language.
+
+    The claim is copied into every access token issued from it, so the
+    language middleware can read it without a database round trip. A token
+    sent back for refresh has the claim read again, the language may have
+    changed since the token was issued.
+    """
+
+    def __init__(self, token: Optional[Token | str] = None, verify: bool = True) -> None:
+        super().__init__(token, verify)
+
+        if token is None:
+            return
+
+        user_id = self.payload.get(api_settings.USER_ID_CLAIM)
+        language = get_preferred_language(user_id) if user_id else None
+        if language is not None:
+            self[LANGUAGE_CLAIM] = language
+
+    @classmethod
+    def for_user(cls, user: CustomUser) -> 'LocalizedRefreshToken':
+        token: Any = super().for_user(user)
+        token[LANGUAGE_CLAIM] = user.preferred_language
+        return token
@@ -1,6 +1,6 @@
 from typing import Any
-from rest_framework_simplejwt.tokens import RefreshToken
 
+from django.db import transaction
 from django.utils.translation import get_language
 from rest_framework.generics import (
     CreateAPIView,
@@ -16,6 +16,7 @@ from apps.users.serializers import (
     CustomUserRegisterSerializer,
     CustomUserLocalizationSerializer
 )
+from apps.users.tokens import LocalizedRefreshToken
 from apps.abstracts.utils import send_welcome_email
 class CreateUserAPIView(CreateAPIView):
     queryset = CustomUser.objects.all()
@@ -26,7 +27,7 @@ class CreateUserAPIView(CreateAPIView):
     def get_tokens_for_user(user:CustomUser) -> object:
         """Returns JWT tokens for special user""" 
 
-        refresh = RefreshToken.for_user(user)
+        refresh = LocalizedRefreshToken.for_user(user)
         return {
             'refresh' : str(refresh),
             'access' : str(refresh.access_token)
@@ -37,10 +38,11 @@ class CreateUserAPIView(CreateAPIView):
         
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
-        tokens = self.get_tokens_for_user(user)
+        with transaction.atomic():
+            user = serializer.save()
+            send_welcome_email(user)
 
-        send_welcome_email(user)
+        tokens = self.get_tokens_for_user(user)
 
         return DRFResponse(
             {**serializer.data, **tokens}, status=HTTP_201_CREATED
@@ -0,0 +1,56 @@
+"""
+Benchmarks of the hot paths, run from the project root as modules:
+
+    BLOG_ENV_ID=local python -m benchmarks.formatters
+
+Settings are picked like manage.py picks them. Benchmarks that write run
+against a throwaway test database, never the configured one.
+"""
+
+# Python modules
+import os
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Iterator
+
+
+def setup() -> None:
+    """Configures Django the way manage.py does"""
+
+    from settings.conf import ENV_ID, ENV_POSSIBLE_OPTIONS
+
+    assert ENV_ID in ENV_POSSIBLE_OPTIONS, f"Set correct BLOG_ENV_ID env var. Possible options: {ENV_POSSIBLE_OPTIONS}"
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', f"settings.env.{ENV_ID}")
+
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def test_database() -> Iterator[None]:
+    """Creates a migrated test database and drops it afterwards"""
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def best_of(function: Callable[[], object], repeat: int = 5) -> float:
+    """Returns the fastest of `repeat` runs in seconds"""
+
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        function()
+        timings.append(perf_counter() - started)
+
+    return min(timings)
@@ -0,0 +1,89 @@
+"""
+Load-tests the post read endpoints of a running server and compares the
+async read path with the DRF one (`format=json` sends a request through
+PostViewSet):
+
+    BLOG_ENV_ID=local daphne -p 8000 settings.asgi:application
+    python -m benchmarks.daphne_load --url http://127.0.0.1:8000/api/posts/ --requests 5000 --concurrency 50
+
+Prints requests per second and latency percentiles of both paths. The
+client runs in threads of this process, keep it on another core than
+the server.
+"""
+
+# Python modules
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection
+from statistics import quantiles
+from time import perf_counter
+from urllib.parse import urlencode, urlsplit
+
+
+def run_worker(url: str, count: int, headers: dict[str, str]) -> list[float]:
+    """Sends `count` requests over one keep-alive connection, returns latencies"""
+
+    parts = urlsplit(url)
+    connection = HTTPConnection(parts.hostname, parts.port or 80)
+    target = f'{parts.path}?{parts.query}' if parts.query else parts.path
+    latencies = []
+
+    try:
+        for _ in range(count):
+            started = perf_counter()
+            connection.request('GET', target, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            latencies.append(perf_counter() - started)
+
+            if response.status not in (200, 304):
+                raise RuntimeError(f"{url} answered {response.status}")
+    finally:
+        connection.close()
+
+    return latencies
+
+
+def load(url: str, requests: int, concurrency: int, headers: dict[str, str]) -> tuple[float, list[float]]:
+    """Returns requests per second and every latency"""
+
+    shares = [requests // concurrency + (worker < requests % concurrency) for worker in range(concurrency)]
+
+    started = perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda count: run_worker(url, count, headers), shares))
+    elapsed = perf_counter() - started
+
+    latencies = [latency for result in results for latency in result]
+    return len(latencies) / elapsed, latencies
+
+
+def with_params(url: str, **params: str) -> str:
+    return f"{url}{'&' if urlsplit(url).query else '?'}{urlencode(params)}"
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--url', default='http://127.0.0.1:8000/api/posts/')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--token', help="Access token sent as Bearer")
+    parser.add_argument('--warmup', type=int, default=200)
+    args = parser.parse_args()
+
+    headers = {'Accept': 'application/json'}
+    if args.token:
+        headers['Authorization'] = f'Bearer {args.token}'
+
+    for name, url in (('DRF', with_params(args.url, format='json')), ('async', args.url)):
+        load(url, args.warmup, min(args.concurrency, args.warmup), headers)
+        rps, latencies = load(url, args.requests, args.concurrency, headers)
+        percentiles = quantiles(latencies, n=100)
+        print(
+            f"{name:>5}: {rps:8.1f} req/s, "
+            f"p50 {percentiles[49] * 1000:7.1f} ms, p99 {percentiles[98] * 1000:7.1f} ms"
+        )
+
+
+if __name__ == '__main__':
+    main()
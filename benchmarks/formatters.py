@@ -0,0 +1,46 @@
+"""
+Formats datetimes with babel format_datetime and with LocalDateTimeFormatter:
+
+    BLOG_ENV_ID=local python -m benchmarks.formatters --count 10000 --language ru --timezone Asia/Almaty
+"""
+
+# Python modules
+from argparse import ArgumentParser
+from datetime import datetime, timedelta, timezone
+
+# Project modules
+from benchmarks import best_of, setup
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=10_000)
+    parser.add_argument('--language', default='ru')
+    parser.add_argument('--timezone', default='Asia/Almaty')
+    args = parser.parse_args()
+
+    setup()
+
+    from babel.dates import format_datetime
+
+    from apps.abstracts.formatters import LocalDateTimeFormatter
+
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    values = [start + timedelta(minutes=37 * number) for number in range(args.count)]
+
+    def with_babel() -> None:
+        for value in values:
+            format_datetime(value, format='long', tzinfo=args.timezone, locale=args.language)
+
+    def with_formatter() -> None:
+        formatter = LocalDateTimeFormatter(args.language, args.timezone)
+        for value in values:
+            formatter.format(value)
+
+    print(f"{args.count} datetimes, {args.language}, {args.timezone}")
+    print(f"format_datetime:        {best_of(with_babel):.3f}s")
+    print(f"LocalDateTimeFormatter: {best_of(with_formatter):.3f}s")
+
+
+if __name__ == '__main__':
+    main()
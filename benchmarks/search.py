@@ -0,0 +1,98 @@
+"""
+Times the first page of a post search on SQLite with the FTS5 index,
+with the per-row rank subquery it replaced and with icontains:
+
+    BLOG_ENV_ID=local python -m benchmarks.search --posts 50000 --matches 2000 20000
+
+Each run fetches a page of 20 posts and counts every match, like the
+search endpoint does. The rank subquery is quadratic in the matches, it
+is skipped above --correlated-max-matches.
+"""
+
+# Python modules
+from argparse import ArgumentParser
+
+# Project modules
+from benchmarks import best_of, setup, test_database
+
+PAGE_SIZE = 20
+WORD = 'kubernetes'
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--posts', type=int, default=50_000)
+    parser.add_argument('--matches', type=int, nargs='+', default=[200, 2000, 20_000])
+    parser.add_argument('--correlated-max-matches', type=int, default=2000)
+    args = parser.parse_args()
+
+    setup()
+
+    from django.db import connection
+    from django.db.models import Q, QuerySet
+    from django.db.models.expressions import RawSQL
+
+    from apps.blog.models import Post
+    from apps.blog.search import FTS_TABLE, POST_TABLE, search_posts_sqlite
+    from apps.users.models import CustomUser
+
+    assert connection.vendor == 'sqlite', "The FTS5 search is SQLite only"
+
+    def correlated(queryset: QuerySet, query: str) -> QuerySet:
+        match = f'"{query}"*'
+        return queryset.filter(
+            pk__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', (match,)),
+        ).annotate(
+            rank=RawSQL(
+                f'SELECT bm25({FTS_TABLE}, 10.0, 1.0) FROM {FTS_TABLE} '
+                f'WHERE {FTS_TABLE} MATCH %s AND rowid = "{POST_TABLE}"."id"',
+                (match,),
+            ),
+        ).order_by('rank', '-created_at', '-pk')
+
+    def icontains(queryset: QuerySet, query: str) -> QuerySet:
+        return queryset.filter(Q(title__icontains=query) | Q(body__icontains=query)).order_by('-created_at', '-pk')
+
+    searches = (('fts5 join', search_posts_sqlite), ('fts5 correlated', correlated), ('icontains', icontains))
+
+    with test_database():
+        author = CustomUser.objects.create_user(
+            email='bench@example.com',
+            first_name='Bench',
+            last_name='Mark',
+            password='pass12345xx',
+        )
+
+        for matches in args.matches:
+            Post.all_objects.all().delete()
+            Post.objects.bulk_create(
+                [
+                    Post(
+                        author=author,
+                        title=f'Post {number}',
+                        slug=f'post-{number}',
+                        body=f"Notes on {WORD if number < matches else 'django'} and deployment " * 20,
+                        status=Post.STATUS_PUBLISHED,
+                    )
+                    for number in range(args.posts)
+                ],
+                batch_size=1000,
+            )
+
+            print(f"{args.posts} posts, {matches} matching:")
+            for name, search in searches:
+                if search is correlated and matches > args.correlated_max_matches:
+                    print(f"  {name:>16}: skipped")
+                    continue
+
+                queryset = search(Post.objects.filter(status=Post.STATUS_PUBLISHED), WORD)
+
+                def first_page() -> None:
+                    list(queryset[:PAGE_SIZE])
+                    queryset.count()
+
+                print(f"  {name:>16}: {best_of(first_page, repeat=3):.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Creates posts that share one title and shows how slug allocation scales
+with the number of slugs already taken:
+
+    BLOG_ENV_ID=local python -m benchmarks.slugs --count 1000
+
+At every checkpoint the single aggregate of next_available_slug is
+compared with the exists() probing loop the models used before.
+"""
+
+# Python modules
+from argparse import ArgumentParser
+from time import perf_counter
+
+# Project modules
+from benchmarks import best_of, setup, test_database
+
+CHECKPOINTS = (1, 10, 100, 1000, 10000)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--title', default='Weekly update')
+    args = parser.parse_args()
+
+    setup()
+
+    from django.db import connection, reset_queries
+    from django.test.utils import CaptureQueriesContext
+    from django.utils.text import slugify
+
+    from apps.abstracts.slugs import next_available_slug
+    from apps.blog.models import Post
+    from apps.users.models import CustomUser
+
+    def probe(base_slug: str) -> str:
+        slug, counter = base_slug, 1
+        while Post._base_manager.filter(slug=slug).exists():
+            slug = f'{base_slug}-{counter}'
+            counter += 1
+        return slug
+
+    def measure(function, base_slug: str) -> tuple[int, float]:
+        with CaptureQueriesContext(connection) as queries:
+            function(base_slug)
+        return len(queries), best_of(lambda: function(base_slug), repeat=3)
+
+    with test_database():
+        author = CustomUser.objects.create_user(
+            email='bench@example.com',
+            first_name='Bench',
+            last_name='Mark',
+            password='pass12345xx',
+        )
+        base_slug = slugify(args.title)
+        checkpoints = [count for count in CHECKPOINTS if count <= args.count]
+
+        print(f"{'taken':>6} {'create ms':>10} {'aggregate':>16} {'probing':>20}")
+        created = 0
+        while created < args.count:
+            # DEBUG keeps a bounded query log, a full one hides new queries
+            reset_queries()
+            started = perf_counter()
+            with CaptureQueriesContext(connection) as create_queries:
+                Post.objects.create(author=author, title=args.title, body='Body', status=Post.STATUS_PUBLISHED)
+            create_ms = (perf_counter() - started) * 1000
+            created += 1
+
+            if created in checkpoints or created == args.count:
+                aggregate_queries, aggregate_time = measure(
+                    lambda slug: next_available_slug(Post._base_manager.all(), slug),
+                    base_slug,
+                )
+                probe_queries, probe_time = measure(probe, base_slug)
+                print(
+                    f"{created:>6} {create_ms:>6.2f} ({len(create_queries)}q) "
+                    f"{aggregate_queries:>3}q {aggregate_time * 1000:>8.2f} ms "
+                    f"{probe_queries:>6}q {probe_time * 1000:>9.2f} ms"
+                )
+
+
+if __name__ == '__main__':
+    main()
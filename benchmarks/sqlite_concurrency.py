@@ -0,0 +1,108 @@
+"""
+Runs reader and writer threads against a file-backed SQLite database,
+once with SQLite defaults and once with the pragmas that
+configure_sqlite_connection applies:
+
+    BLOG_ENV_ID=local python -m benchmarks.sqlite_concurrency --readers 8 --writers 2 --seconds 5
+
+Writers take the lock up front like the IMMEDIATE transaction mode of
+the settings. Prints throughput, p99 latency and "database is locked"
+errors of both roles.
+"""
+
+# Python modules
+import sqlite3
+from argparse import ArgumentParser
+from os import path
+from statistics import quantiles
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import perf_counter
+from typing import Any
+
+# Project modules
+from benchmarks import setup
+
+SEED_ROWS = 10_000
+
+
+def connect(database: str, pragmas: dict[str, Any]) -> sqlite3.Connection:
+    # Python's default busy timeout, like Django without OPTIONS['timeout']
+    db = sqlite3.connect(database, timeout=5.0, isolation_level=None, check_same_thread=False)
+    for name, value in pragmas.items():
+        db.execute(f'PRAGMA {name} = {value}')
+    return db
+
+
+def work(database: str, pragmas: dict[str, Any], writer: bool, stop_at: float, result: dict[str, Any]) -> None:
+    db = connect(database, pragmas)
+    latencies = []
+    errors = 0
+
+    while perf_counter() < stop_at:
+        started = perf_counter()
+        try:
+            if writer:
+                db.execute('BEGIN IMMEDIATE')
+                db.execute('INSERT INTO items (body) VALUES (?)', ('x' * 200,))
+                db.execute('COMMIT')
+            else:
+                db.execute('SELECT id, body FROM items ORDER BY id DESC LIMIT 20').fetchall()
+        except sqlite3.OperationalError:
+            errors += 1
+            if db.in_transaction:
+                db.execute('ROLLBACK')
+            continue
+        latencies.append(perf_counter() - started)
+
+    db.close()
+    result['latencies'] = latencies
+    result['errors'] = errors
+
+
+def run(database: str, pragmas: dict[str, Any], readers: int, writers: int, seconds: float) -> None:
+    db = connect(database, pragmas)
+    db.execute('CREATE TABLE items (id INTEGER PRIMARY KEY, body TEXT NOT NULL)')
+    db.executemany('INSERT INTO items (body) VALUES (?)', [('x' * 200,)] * SEED_ROWS)
+    db.close()
+
+    stop_at = perf_counter() + seconds
+    results = {'reader': [], 'writer': []}
+    threads = []
+    for role, count in (('reader', readers), ('writer', writers)):
+        for _ in range(count):
+            result: dict[str, Any] = {}
+            results[role].append(result)
+            threads.append(Thread(target=work, args=(database, pragmas, role == 'writer', stop_at, result)))
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for role, role_results in results.items():
+        latencies = [latency for result in role_results for latency in result['latencies']]
+        errors = sum(result['errors'] for result in role_results)
+        p99 = quantiles(latencies, n=100)[98] * 1000 if len(latencies) > 1 else float('nan')
+        print(f"  {role}s: {len(latencies) / seconds:9.1f} ops/s, p99 {p99:8.2f} ms, {errors} locked")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+
+    setup()
+
+    from apps.abstracts.signals import SQLITE_PRAGMAS
+
+    for name, pragmas in (('SQLite defaults', {}), ('SQLITE_PRAGMAS', SQLITE_PRAGMAS)):
+        with TemporaryDirectory() as directory:
+            print(f"{name}, {args.readers} readers, {args.writers} writers:")
+            run(path.join(directory, 'bench.sqlite3'), pragmas, args.readers, args.writers, args.seconds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Renders the welcome email of every language with the configured template
+engine and with the same engine minus the cached loader:
+
+    BLOG_ENV_ID=prod python -m benchmarks.welcome_email --count 1000
+
+Prints the time per rendered email.
+"""
+
+# Python modules
+from argparse import ArgumentParser
+
+# Project modules
+from benchmarks import best_of, setup
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1000)
+    args = parser.parse_args()
+
+    setup()
+
+    from django.template import Engine, engines
+
+    from apps.abstracts.utils import WELCOME_TEMPLATE, warm_welcome_templates
+    from apps.users.models import CustomUser
+    from settings.base import HOME_PAGE_URL
+
+    configured = engines['django'].engine
+    uncached = Engine(
+        dirs=configured.dirs,
+        loaders=[
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ],
+        libraries=configured.libraries,
+    )
+    warm_welcome_templates()
+
+    print(f"{'language':>8} {'uncached':>12} {'configured':>12}")
+    for language in CustomUser.LANGUAGE_CODES:
+        name = WELCOME_TEMPLATE.format(lang=language)
+        context = {
+            'user_name': CustomUser(first_name='Bench', last_name='Mark', email='bench@example.com'),
+            'site_url': HOME_PAGE_URL,
+        }
+
+        def render(engine: Engine) -> None:
+            for _ in range(args.count):
+                engine.render_to_string(name, context)
+
+        timings = [best_of(lambda: render(engine), repeat=3) / args.count for engine in (uncached, configured)]
+        print(f"{language:>8} " + ' '.join(f"{timing * 1_000_000:>9.1f} us" for timing in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -9,15 +9,19 @@ from channels.security.websocket import AllowedHostsOriginValidator
 
 # Project modules
 from settings.conf import ENV_ID, ENV_POSSIBLE_OPTIONS
-from apps.notifications.routing import websocket_urlpatterns
 
 assert ENV_ID in ENV_POSSIBLE_OPTIONS, f"Invalid env id. Possible options{ENV_POSSIBLE_OPTIONS}"
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', f"settings.env.{ENV_ID}")
 
+# Loads the apps, the websocket routes below import models
+django_asgi_application = get_asgi_application()
+
+from apps.notifications.routing import websocket_urlpatterns  # noqa: E402
+
 application = ProtocolTypeRouter(
     {
-        "http": get_asgi_application(),
+        "http": django_asgi_application,
         "websocket": AllowedHostsOriginValidator(
             AuthMiddlewareStack(URLRouter(websocket_urlpatterns)))  
     }
@@ -52,7 +52,7 @@ SECRET_KEY = 'django-insecure-c566qv-369ufrzn-_5!jf^b-7b^3*nn3#dh_pfg#phq*k93t$b
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.abstracts.authentication.SharedTokenJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema', 
@@ -96,8 +96,8 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_LIFETIME": timedelta(minutes=5),
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=1),
 
-    "TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainPairSerializer",
-    "TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSerializer",
+    "TOKEN_OBTAIN_SERIALIZER": "apps.users.serializers.LocalizedTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "apps.users.serializers.LocalizedTokenRefreshSerializer",
     "TOKEN_VERIFY_SERIALIZER": "rest_framework_simplejwt.serializers.TokenVerifySerializer",
     "TOKEN_BLACKLIST_SERIALIZER": "rest_framework_simplejwt.serializers.TokenBlacklistSerializer",
     "SLIDING_TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainSlidingSerializer",
@@ -108,6 +108,17 @@ SIMPLE_JWT = {
     "CHECK_USER_IS_ACTIVE": True,
 }
 
+# -------------------------------
+# DJANGO CACHE
+# 
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    },
+}
+
 # -------------------------------
 # DJANGO CHANNELS
 # 
@@ -120,4 +131,20 @@ CHANNEL_LAYERS = {
             "symmetric_encryption_keys": [SECRET_KEY],
         },
     },
-}
\ No newline at end of file
+}
+# -------------------------------
+# COMMENT BROADCASTS
+# 
+
+COMMENT_BROADCAST = {
+    # Events waiting for the dispatcher before writes start to wait
+    "QUEUE_SIZE": 1000,
+    # Events sent to the channel layer concurrently
+    "BATCH_SIZE": 100,
+    # Seconds a write waits for room in a full queue before dropping
+    "ENQUEUE_TIMEOUT": 0.05,
+    # Seconds comments of a post are gathered into one frame, 0 disables
+    "COALESCE_WINDOW": 0,
+    # Comments in one frame; a full frame is sent before its window ends
+    "COALESCE_MAX_EVENTS": 50,
+}
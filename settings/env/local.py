@@ -7,6 +7,10 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': 'db.sqlite3',
+        'OPTIONS': {
+            # Writers take the lock up front instead of failing to upgrade
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
@@ -3,11 +3,65 @@ from settings.base import *
 DEBUG = False
 ALLOWED_HOSTS = ["*"]
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': 'db.sqlite3',
+from decouple import config
+
+# -------------------------------
+# Database
+#
+# PostgreSQL when POSTGRES_HOST is set, SQLite in WAL mode otherwise
+#
+POSTGRES_HOST = config("POSTGRES_HOST", cast=str, default="")
+
+if POSTGRES_HOST:
+    POSTGRES_POOL = config("POSTGRES_POOL", cast=bool, default=False)
+
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'HOST': POSTGRES_HOST,
+            'PORT': config("POSTGRES_PORT", cast=str, default="5432"),
+            'NAME': config("POSTGRES_DB", cast=str),
+            'USER': config("POSTGRES_USER", cast=str),
+            'PASSWORD': config("POSTGRES_PASSWORD", cast=str),
+            # The pool already keeps connections open, and Django refuses
+            # persistent connections on top of it.
+            'CONN_MAX_AGE': 0 if POSTGRES_POOL else config(
+                "POSTGRES_CONN_MAX_AGE", cast=int, default=60,
+            ),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {},
+        }
     }
-}
 
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
\ No newline at end of file
+    if POSTGRES_POOL:
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': config("POSTGRES_POOL_MIN_SIZE", cast=int, default=2),
+            'max_size': config("POSTGRES_POOL_MAX_SIZE", cast=int, default=10),
+            'timeout': config("POSTGRES_POOL_TIMEOUT", cast=float, default=10.0),
+        }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': 'db.sqlite3',
+            # WAL and the other pragmas are set by apps.abstracts.signals
+            'OPTIONS': {
+                # Writers take the lock up front instead of failing to upgrade
+                'transaction_mode': 'IMMEDIATE',
+            },
+        }
+    }
+
+EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+
+# Compiled templates are kept for the life of the process
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [
+    (
+        'django.template.loaders.cached.Loader',
+        [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ],
+    ),
+]